@@ -25,7 +25,6 @@ INSTALLED_APPS = [
     'reviews',
     'rest_framework',
     'rest_framework.authtoken',
-    'django_celery_results',
 ]
 
 MIDDLEWARE = [
@@ -65,8 +64,10 @@ DATABASES = {
         'PASSWORD': 'YOUR_POSTGRES_PASSWORD_HERE', # We will set this in the local file
         'HOST': 'localhost',
         'PORT': '5432',
-'OPTIONS': {
-            'charset': 'utf8mb4',
+        'CONN_MAX_AGE': 600,
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            'connect_timeout': 5,
         },
     }
 }
@@ -90,12 +91,25 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 # CELERY SETTINGS
 # This points to your WSL instance
 CELERY_BROKER_URL = 'redis://172.19.96.183:6379/0'
-CELERY_RESULT_BACKEND = 'django-db'
+CELERY_RESULT_BACKEND = CELERY_BROKER_URL
 CELERY_ACCEPT_CONTENT = ['application/json']
 CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = 'UTC'
 
+# CACHE SETTINGS
+# Must be shared with the Celery workers: task progress and the cached API
+# payloads keyed on it are written by workers and read by web processes
+CACHES = {
+    'default': {
+        'BACKEND': 'django_redis.cache.RedisCache',
+        'LOCATION': 'redis://172.19.96.183:6379/1',
+        'OPTIONS': {
+            'CLIENT_CLASS': 'django_redis.client.DefaultClient',
+        }
+    }
+}
+
 # CORS SETTINGS
 CORS_ALLOWED_ORIGINS = [
     "http://localhost:5173",
@@ -107,10 +121,10 @@ CORS_ALLOWED_ORIGINS = [
 CORS_ALLOW_CREDENTIALS = True
 REST_FRAMEWORK = {
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'reviews.renderers.ORJSONRenderer',
     ],
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework.authentication.TokenAuthentication',
+        'reviews.authentication.ProfileTokenAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
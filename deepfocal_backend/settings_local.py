@@ -19,9 +19,21 @@ DATABASES = {
         'PASSWORD': os.getenv('DB_PASSWORD'),
         'HOST': os.getenv('DB_HOST', 'localhost'),
         'PORT': os.getenv('DB_PORT', '5432'),
+        # Reuse connections across requests and tasks; Celery's Django fixup
+        # already calls close_if_unusable_or_obsolete() around each task.
+        'CONN_MAX_AGE': int(os.getenv('DB_CONN_MAX_AGE', '600')),
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            'connect_timeout': int(os.getenv('DB_CONNECT_TIMEOUT', '5')),
+        },
     }
 }
 
+# Optional server-side cap on runaway queries, e.g. DB_STATEMENT_TIMEOUT_MS=30000.
+# Leave unset when running migrations that build large indexes.
+if os.getenv('DB_STATEMENT_TIMEOUT_MS'):
+    DATABASES['default']['OPTIONS']['options'] = f"-c statement_timeout={int(os.getenv('DB_STATEMENT_TIMEOUT_MS'))}"
+
 # Secret key from environment
 SECRET_KEY = os.getenv('SECRET_KEY')
 if not SECRET_KEY:
@@ -38,6 +50,18 @@ CELERY_ACCEPT_CONTENT = ['json']
 CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = 'UTC'
+# Review imports are long-running; hand each worker one task at a time and
+# only acknowledge it once finished so a lost worker's import is redelivered.
+CELERY_WORKER_PREFETCH_MULTIPLIER = 1
+CELERY_TASK_ACKS_LATE = True
+CELERY_TASK_REJECT_ON_WORKER_LOST = True
+# Token-bucket limit on Google Play imports per worker, so bursts of queued
+# apps are paced by the upstream rate limit instead of fixed sleeps.
+CELERY_TASK_ANNOTATIONS = {
+    'reviews.tasks.collect_reviews_task': {
+        'rate_limit': os.getenv('GOOGLE_PLAY_IMPORT_RATE_LIMIT', '20/m'),
+    },
+}
 
 # Cache configuration
 CACHES = {
@@ -65,7 +89,6 @@ INSTALLED_APPS = [
     'rest_framework',
     'rest_framework.authtoken',
     'corsheaders',
-    'django_celery_results',
     'reviews',
 ]
 
@@ -90,16 +113,20 @@ CORS_ALLOWED_ORIGINS = [
 CORS_ALLOW_CREDENTIALS = True
 
 CELERY_TASK_ALWAYS_EAGER = False
-CELERY_WORKER_POOL = 'solo'
+# Sentiment scoring is CPU-bound, so run imports in parallel processes.
+# Windows development machines can set CELERY_WORKER_POOL=solo.
+CELERY_WORKER_POOL = os.getenv('CELERY_WORKER_POOL', 'prefork')
+if os.getenv('CELERY_WORKER_CONCURRENCY'):
+    CELERY_WORKER_CONCURRENCY = int(os.getenv('CELERY_WORKER_CONCURRENCY'))
 
 REST_FRAMEWORK = {
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'reviews.renderers.ORJSONRenderer',
     ],
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 20,
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework.authentication.TokenAuthentication',
+        'reviews.authentication.ProfileTokenAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
@@ -1,50 +1,104 @@
 """Utilities for working with app identifiers across platforms."""
 from __future__ import annotations
 
-from typing import Iterable, List, Set
+from itertools import chain
+from typing import Dict, Iterable, List, Set
 
+from django.core.cache import cache
 from django.db.models import Q
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 from .models import CompetitorApp, Project, Review
 
+EXPAND_CACHE_TIMEOUT = 300
+EXPAND_CACHE_VERSION_KEY = "expand_app_ids:version"
+_LINKED_ID_FIELDS = {"home_app_id", "apple_app_id", "app_id"}
+
+
+def _expand_cache_version() -> int:
+    return cache.get_or_set(EXPAND_CACHE_VERSION_KEY, 1, timeout=None)
+
+
+def _expand_cache_key(app_id: str, version: int | None = None) -> str:
+    if version is None:
+        version = _expand_cache_version()
+    return f"expand_app_ids:v{version}:{app_id}"
+
 
 def expand_app_ids(app_id: str | None) -> List[str]:
     """Return all known identifiers (Google + Apple) linked to *app_id*.
 
     This includes the provided identifier, the paired identifier on any matching
     project home app, and identifiers stored on competitor records. Results are
-    de-duped and empty strings are discarded.
+    de-duped and sorted, empty strings are discarded, and lookups are cached
+    until a project or competitor changes.
     """
     if not app_id:
         return []
 
-    app_ids: Set[str] = {app_id}
+    return cache.get_or_set(
+        _expand_cache_key(app_id),
+        lambda: _lookup_linked_ids(app_id),
+        timeout=EXPAND_CACHE_TIMEOUT,
+    )
 
-    project_matches = Project.objects.filter(Q(home_app_id=app_id) | Q(apple_app_id=app_id))
-    for project in project_matches.only("home_app_id", "apple_app_id"):
-        if project.home_app_id:
-            app_ids.add(project.home_app_id)
-        if project.apple_app_id:
-            app_ids.add(project.apple_app_id)
 
-    competitor_matches = CompetitorApp.objects.filter(Q(app_id=app_id) | Q(apple_app_id=app_id))
-    for competitor in competitor_matches.only("app_id", "apple_app_id"):
-        if competitor.app_id:
-            app_ids.add(competitor.app_id)
-        if competitor.apple_app_id:
-            app_ids.add(competitor.apple_app_id)
+def _lookup_linked_ids(app_id: str) -> List[str]:
+    return _lookup_linked_id_map({app_id})[app_id]
 
-    return [value for value in app_ids if value]
 
+def _lookup_linked_id_map(app_ids: Set[str]) -> Dict[str, List[str]]:
+    """Look up the linked identifiers of every id in *app_ids* with one query."""
+    project_rows = Project.objects.filter(
+        Q(home_app_id__in=app_ids) | Q(apple_app_id__in=app_ids)
+    ).values_list("home_app_id", "apple_app_id")
+    competitor_rows = CompetitorApp.objects.filter(
+        Q(app_id__in=app_ids) | Q(apple_app_id__in=app_ids)
+    ).values_list("app_id", "apple_app_id")
 
-def expand_many_app_ids(app_ids: Iterable[str | None]) -> List[str]:
-    """Expand and flatten several identifiers into a unique list."""
-    combined: Set[str] = set()
-    for identifier in app_ids:
-        combined.update(expand_app_ids(identifier))
-    return [value for value in combined if value]
+    linked: Dict[str, Set[str]] = {app_id: {app_id} for app_id in app_ids}
+    for pair in project_rows.union(competitor_rows):
+        for value in pair:
+            if value in linked:
+                linked[value].update(pair)
+    return {
+        app_id: sorted(value for value in values if value)
+        for app_id, values in linked.items()
+    }
+
+
+def expand_app_id_map(app_ids: Iterable[str | None]) -> Dict[str, List[str]]:
+    """Map each identifier to its ``expand_app_ids`` result.
+
+    Cached expansions are read with one ``get_many`` round trip; all misses are
+    resolved by a single query and written back together.
+    """
+    identifiers = {identifier for identifier in app_ids if identifier}
+    if not identifiers:
+        return {}
+
+    version = _expand_cache_version()
+    keys = {_expand_cache_key(identifier, version): identifier for identifier in identifiers}
+    cached = cache.get_many(keys)
+    expanded = {keys[key]: value for key, value in cached.items()}
+
+    missing = identifiers.difference(expanded)
+    if missing:
+        looked_up = _lookup_linked_id_map(missing)
+        cache.set_many(
+            {_expand_cache_key(identifier, version): value for identifier, value in looked_up.items()},
+            timeout=EXPAND_CACHE_TIMEOUT,
+        )
+        expanded.update(looked_up)
+    return expanded
 
 
+def expand_many_app_ids(app_ids: Iterable[str | None]) -> List[str]:
+    """Expand and flatten several identifiers into a unique, sorted list."""
+    combined: Set[str] = set(chain.from_iterable(expand_app_id_map(app_ids).values()))
+    return sorted(combined)
+
 
 def get_reviews_for_app_id(app_id: str):
     """Return queryset of reviews for the given identifier across linked IDs."""
@@ -52,3 +106,18 @@ def get_reviews_for_app_id(app_id: str):
     if not related_ids:
         related_ids = [app_id]
     return Review.objects.filter(app_id__in=related_ids)
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_save, sender=CompetitorApp)
+@receiver(post_delete, sender=Project)
+@receiver(post_delete, sender=CompetitorApp)
+def invalidate_expanded_app_ids(sender, instance, **kwargs):
+    """Drop every cached expansion when identifier links may have changed."""
+    update_fields = kwargs.get("update_fields")
+    if update_fields and not _LINKED_ID_FIELDS.intersection(update_fields):
+        return
+    try:
+        cache.incr(EXPAND_CACHE_VERSION_KEY)
+    except ValueError:
+        cache.set(EXPAND_CACHE_VERSION_KEY, 2, timeout=None)
@@ -4,9 +4,12 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
+from itertools import islice
 from typing import Iterable, List, Optional
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 
 LOGGER = logging.getLogger(__name__)
 
@@ -14,11 +17,25 @@ APPLE_REVIEW_FEED_JSON = "https://itunes.apple.com/{country}/rss/customerreviews
 APPLE_MAX_FEED_REVIEWS = 100
 
 
+def _build_session() -> requests.Session:
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(pool_connections=10, pool_maxsize=20),
+    )
+    return session
+
+
+# Shared by callers that do not pass a session, so keep-alive connections
+# to itunes.apple.com are reused across fetches.
+_SESSION = _build_session()
+
+
 class AppleReviewError(Exception):
     """Raised when the Apple review feed cannot be fetched or parsed."""
 
 
-@dataclass
+@dataclass(slots=True)
 class AppleReview:
     """Structured representation of a single Apple App Store review entry."""
 
@@ -39,51 +56,36 @@ def _normalise_rating(raw_rating: Optional[str]) -> int:
 
 
 def _coerce_text(node: Optional[dict], key: str = "label") -> Optional[str]:
-    if not isinstance(node, dict):
+    # Feed nodes come straight from orjson, so exact type checks are enough
+    if type(node) is not dict:
         return None
     value = node.get(key)
-    return value if isinstance(value, str) else None
+    return value if type(value) is str else None
+
+
+def _parse_entry(raw: dict) -> Optional[AppleReview]:
+    get = raw.get
+    review_id = _coerce_text(get("id"))
+    if not review_id:
+        return None
+
+    author = get("author")
+    return AppleReview(
+        review_id=review_id,
+        author=_coerce_text(author.get("name")) if type(author) is dict else None,
+        title=_coerce_text(get("title")),
+        content=_coerce_text(get("content")) or _coerce_text(get("summary")) or "",
+        rating=_normalise_rating(_coerce_text(get("im:rating"))),
+        app_version=_coerce_text(get("im:version")),
+        updated=_coerce_text(get("updated")),
+    )
 
 
 def parse_apple_feed_entries(entries: Iterable[dict], max_reviews: int = APPLE_MAX_FEED_REVIEWS) -> List[AppleReview]:
     """Convert raw RSS JSON entries into structured review objects."""
 
-    reviews: List[AppleReview] = []
-    for raw in entries:
-        review_id = _coerce_text(raw.get("id"))
-        if not review_id:
-            # Fallback to id.label if nested differently
-            review_id = _coerce_text(raw.get("id"), key="label")
-        if not review_id:
-            continue
-
-        author = _coerce_text(raw.get("author", {}).get("name"))
-        title = _coerce_text(raw.get("title"))
-        content = (
-            _coerce_text(raw.get("content"))
-            or _coerce_text(raw.get("summary"))
-            or ""
-        )
-        rating = _normalise_rating(_coerce_text(raw.get("im:rating")))
-        version = _coerce_text(raw.get("im:version"))
-        updated = _coerce_text(raw.get("updated"))
-
-        reviews.append(
-            AppleReview(
-                review_id=review_id,
-                author=author,
-                title=title,
-                content=content,
-                rating=rating,
-                app_version=version,
-                updated=updated,
-            )
-        )
-
-        if len(reviews) >= max_reviews:
-            break
-
-    return reviews
+    # Entries without an id are skipped, so cap the parsed stream rather than the input
+    return list(islice(filter(None, map(_parse_entry, entries)), max(max_reviews, 1)))
 
 
 def fetch_apple_reviews(
@@ -98,7 +100,7 @@ def fetch_apple_reviews(
         return []
 
     url = APPLE_REVIEW_FEED_JSON.format(country=country.lower(), app_id=app_id)
-    http = session or requests.Session()
+    http = session or _SESSION
 
     LOGGER.debug("Fetching Apple reviews for %s (%s)", app_id, country)
 
@@ -110,8 +112,8 @@ def fetch_apple_reviews(
         raise AppleReviewError(f"Unable to fetch Apple reviews: {exc}") from exc
 
     try:
-        payload = response.json()
-    except ValueError as exc:  # noqa: BLE001
+        payload = orjson.loads(response.content)
+    except orjson.JSONDecodeError as exc:  # noqa: BLE001
         LOGGER.error("Apple review feed returned invalid JSON: %s", exc)
         raise AppleReviewError("Apple review feed returned invalid JSON") from exc
 
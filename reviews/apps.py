@@ -1,6 +1,32 @@
 from django.apps import AppConfig
+from django.conf import settings
+from django.core import checks
 
 
 class ReviewsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'reviews'
+
+    def ready(self):
+        # Connect the identifier cache invalidation receivers in every process
+        from . import app_id_utils  # noqa: F401
+        checks.register(check_shared_cache, checks.Tags.caches)
+
+
+PROCESS_LOCAL_CACHES = {
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+}
+
+
+def check_shared_cache(app_configs, **kwargs):
+    """Warn when the default cache is not shared between web and worker processes."""
+    backend = settings.CACHES.get('default', {}).get('BACKEND', 'django.core.cache.backends.locmem.LocMemCache')
+    if backend in PROCESS_LOCAL_CACHES:
+        return [checks.Warning(
+            f"The default cache ({backend}) is local to each process.",
+            hint="Task progress and cached API payloads are written by Celery workers; "
+                 "configure a shared cache such as django_redis.",
+            id='reviews.W001',
+        )]
+    return []
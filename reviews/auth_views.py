@@ -6,9 +6,22 @@ from rest_framework.authtoken.models import Token
 from django.contrib.auth import authenticate
 from django.contrib.auth.models import User
 from django.conf import settings
+from django.db import IntegrityError
 from .models import UserProfile
 
 
+def _ensure_token(user):
+    """Return the user's auth token, creating it only when missing."""
+    token = Token.objects.filter(user=user).only('key').first()
+    if token:
+        return token
+    try:
+        return Token.objects.create(user=user)
+    except IntegrityError:
+        # A concurrent login created it first
+        return Token.objects.get(user=user)
+
+
 @api_view(['POST'])
 @permission_classes([AllowAny])
 def register(request):
@@ -72,8 +85,8 @@ def login(request):
     user = authenticate(username=username, password=password)
 
     if user:
-        token, created = Token.objects.get_or_create(user=user)
-        profile = UserProfile.objects.get_or_create(user=user)[0]
+        token = _ensure_token(user)
+        profile = UserProfile.for_user(user)
 
         return Response({
             'token': token.key,
@@ -93,7 +106,8 @@ def user_profile(request):
     """
     Get current user's profile information
     """
-    profile = UserProfile.objects.get_or_create(user=request.user)[0]
+    # Loaded alongside the token by ProfileTokenAuthentication
+    profile = UserProfile.for_user(request.user)
 
     return Response({
         'user_id': request.user.id,
@@ -116,8 +130,7 @@ def logout(request):
     """
     Logout user by deleting their token
     """
-    try:
-        request.user.auth_token.delete()
+    deleted, _ = Token.objects.filter(user_id=request.user.id).delete()
+    if deleted:
         return Response({'message': 'Successfully logged out'})
-    except:
-        return Response({'error': 'Error logging out'}, status=status.HTTP_400_BAD_REQUEST)
+    return Response({'error': 'Error logging out'}, status=status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,24 @@
+"""DRF authentication classes for the reviews API."""
+from django.utils.translation import gettext_lazy as _
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication
+
+
+class ProfileTokenAuthentication(TokenAuthentication):
+    """Token auth that loads the user's profile in the same query as the token.
+
+    Most views read ``request.user.userprofile`` for tier limits, so joining it
+    here saves a query on every authenticated request.
+    """
+
+    def authenticate_credentials(self, key):
+        model = self.get_model()
+        try:
+            token = model.objects.select_related('user', 'user__userprofile').get(key=key)
+        except model.DoesNotExist:
+            raise exceptions.AuthenticationFailed(_('Invalid token.'))
+
+        if not token.user.is_active:
+            raise exceptions.AuthenticationFailed(_('User inactive or deleted.'))
+
+        return (token.user, token)
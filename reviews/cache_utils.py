@@ -0,0 +1,46 @@
+"""Cache invalidation helpers shared by API views and background tasks."""
+from __future__ import annotations
+
+import time
+from typing import Iterable
+
+from django.core.cache import cache
+from django.db.models import Q
+
+from .models import Project
+
+
+def mark_reviews_updated(app_ids: Iterable[str | None]) -> None:
+    """Bump the data timestamps that key cached analytics for *app_ids*.
+
+    Bulk writes skip the ``post_save`` signal, so ingest code paths call this
+    explicitly once their reviews are stored.
+    """
+    app_ids = [app_id for app_id in set(app_ids) if app_id]
+    timestamp = int(time.time())
+
+    # Update general timestamp
+    cache.set('last_data_update', timestamp)
+    if not app_ids:
+        return
+
+    # Update app-specific timestamps
+    cache.set_many({f'last_data_update_{app_id}': timestamp for app_id in app_ids})
+
+    # Update project timestamps for projects that include these apps
+    project_ids = Project.objects.filter(
+        Q(home_app_id__in=app_ids) |
+        Q(apple_app_id__in=app_ids) |
+        Q(competitors__app_id__in=app_ids) |
+        Q(competitors__apple_app_id__in=app_ids)
+    ).values_list('id', flat=True).distinct()
+    cache.set_many({f'last_project_update_{project_id}': timestamp for project_id in project_ids})
+
+    # Clear cache patterns (if your cache backend supports it)
+    try:
+        cache.delete_pattern("competitor_analysis_*")
+        cache.delete_pattern("enhanced_insights_*")
+        cache.delete_pattern("strategic_performance_*")
+    except AttributeError:
+        # Fallback for cache backends that don't support delete_pattern
+        pass
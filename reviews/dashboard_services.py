@@ -1,24 +1,21 @@
 """Dashboard analytics helpers for premium UI."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+import hashlib
+import json
 from datetime import timedelta
 from typing import Dict, Iterable, List, Optional
 
-from django.db.models import Avg, Count, Q
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Avg, CharField, Count, F, Func, Min, Q, Value
 from django.db.models.functions import TruncDay, TruncWeek
 from django.utils import timezone
 
-from .models import CompetitorApp, Project, Review
-from .app_id_utils import expand_app_ids, expand_many_app_ids
+from .models import Project, Review
+from .app_id_utils import EXPAND_CACHE_VERSION_KEY, expand_app_ids, expand_many_app_ids
 
-
-@dataclass
-class SentimentBucket:
-    date_label: str
-    positive: float
-    negative: float
-    competitor: Optional[float] = None
+DASHBOARD_CACHE_TIMEOUT = 1800
 
 
 def _bounded(value: float, lower: float = 0.0, upper: float = 100.0) -> float:
@@ -32,29 +29,56 @@ def _project_home_ids(project: Project) -> List[str]:
 def _competitor_app_ids(project: Project, identifier: str | None) -> List[str]:
     if not identifier:
         return []
-    competitor = project.competitors.filter(
+    pair = project.competitors.filter(
         Q(app_id=identifier) | Q(apple_app_id=identifier)
-    ).first()
-    if competitor:
-        return [app_id for app_id in {competitor.app_id, competitor.apple_app_id} if app_id]
+    ).values_list("app_id", "apple_app_id").first()
+    if pair:
+        return [app_id for app_id in set(pair) if app_id]
     return expand_app_ids(identifier)
 
 
+def _cached_result(endpoint: str, key_data: Dict, compute) -> object:
+    """Return a cached result keyed by *key_data*, computing it on a miss.
+
+    Keys embed the data/project timestamps maintained by
+    ``cache_utils.mark_reviews_updated`` and the linked-id version, so new
+    reviews or competitor changes produce a fresh key.
+    """
+    key_data = dict(
+        key_data,
+        endpoint=endpoint,
+        id_version=cache.get(EXPAND_CACHE_VERSION_KEY, 0),
+    )
+    cache_key = hashlib.md5(json.dumps(key_data, sort_keys=True).encode()).hexdigest()
+    return cache.get_or_set(f"{endpoint}_{cache_key}", compute, DASHBOARD_CACHE_TIMEOUT)
+
+
 def calculate_strategic_scores(project: Project) -> Dict[str, float]:
     """Derive MVP strategic metrics from review sentiment data."""
-    home_ids = _project_home_ids(project)
-    home_stats = _aggregate_sentiment_metrics(home_ids)
-
-    competitor_records = list(CompetitorApp.objects.filter(project=project).only(
-        "app_id", "apple_app_id"
-    ))
-    competitor_ids: List[str] = []
-    for competitor in competitor_records:
-        if competitor.app_id:
-            competitor_ids.append(competitor.app_id)
-        if competitor.apple_app_id:
-            competitor_ids.append(competitor.apple_app_id)
-    competitor_stats = _aggregate_sentiment_metrics(competitor_ids) if competitor_ids else None
+    return _cached_result(
+        "strategic_scores",
+        {
+            "project_id": project.id,
+            "timestamp": cache.get(f"last_project_update_{project.id}", 0),
+        },
+        lambda: _compute_strategic_scores(project),
+    )
+
+
+def _compute_strategic_scores(project: Project) -> Dict[str, float]:
+    competitor_ids = [
+        app_id
+        for pair in project.competitors.values_list("app_id", "apple_app_id")
+        for app_id in pair
+        if app_id
+    ]
+
+    groups = {"home": _project_home_ids(project)}
+    if competitor_ids:
+        groups["competitor"] = competitor_ids
+    stats = _aggregate_sentiment_metrics(groups)
+    home_stats = stats["home"]
+    competitor_stats = stats.get("competitor")
 
     positive_pct = home_stats.get("positive_percentage", 0.0)
     churn_risk = _bounded(100.0 - (positive_pct * 1.2))
@@ -82,31 +106,47 @@ def calculate_strategic_scores(project: Project) -> Dict[str, float]:
         },
     }
 
-def _aggregate_sentiment_metrics(app_ids: Iterable[str]) -> Dict[str, float]:
-    expanded_ids = expand_many_app_ids(app_ids)
-    if not expanded_ids:
-        return {
+def _aggregate_sentiment_metrics(groups: Dict[str, Iterable[str]]) -> Dict[str, Dict[str, float]]:
+    """Aggregate sentiment for several app id groups in one query.
+
+    Each group gets its own filtered aggregates, so an id shared by two
+    groups still counts towards both.
+    """
+    expanded = {name: expand_many_app_ids(app_ids) for name, app_ids in groups.items()}
+
+    aggregates = {}
+    for name, app_ids in expanded.items():
+        if not app_ids:
+            continue
+        in_group = Q(app_id__in=app_ids)
+        aggregates[f"{name}_total"] = Count("id", filter=in_group)
+        aggregates[f"{name}_positive"] = Count("id", filter=in_group & Q(sentiment_score__gt=0.1))
+        aggregates[f"{name}_negative"] = Count("id", filter=in_group & Q(sentiment_score__lt=-0.1))
+        aggregates[f"{name}_avg_sentiment"] = Avg("sentiment_score", filter=in_group)
+
+    aggregated = {}
+    if aggregates:
+        aggregated = Review.objects.filter(
+            app_id__in=set().union(*expanded.values()),
+            sentiment_score__isnull=False,
+            counts_toward_score=True,
+        ).aggregate(**aggregates)
+
+    return {
+        name: _summarise_sentiment(aggregated, name) if app_ids else {
             "total_reviews": 0,
             "positive_percentage": 0.0,
             "negative_percentage": 0.0,
             "avg_sentiment": 0.0,
         }
+        for name, app_ids in expanded.items()
+    }
 
-    queryset = Review.objects.filter(
-        app_id__in=expanded_ids,
-        sentiment_score__isnull=False,
-        counts_toward_score=True,
-    )
-    aggregated = queryset.aggregate(
-        total=Count("id"),
-        positive=Count("id", filter=Q(sentiment_score__gt=0.1)),
-        negative=Count("id", filter=Q(sentiment_score__lt=-0.1)),
-        avg_sentiment=Avg("sentiment_score"),
-    )
 
-    total = aggregated.get("total") or 0
-    positive = aggregated.get("positive") or 0
-    negative = aggregated.get("negative") or 0
+def _summarise_sentiment(aggregated: Dict, prefix: str) -> Dict[str, float]:
+    total = aggregated.get(f"{prefix}_total") or 0
+    positive = aggregated.get(f"{prefix}_positive") or 0
+    negative = aggregated.get(f"{prefix}_negative") or 0
     neutral = max(total - positive - negative, 0)
 
     def pct(part: int) -> float:
@@ -120,7 +160,7 @@ def _aggregate_sentiment_metrics(app_ids: Iterable[str]) -> Dict[str, float]:
         "positive_percentage": pct(positive),
         "negative_percentage": pct(negative),
         "neutral_percentage": pct(neutral),
-        "avg_sentiment": round(aggregated.get("avg_sentiment") or 0.0, 4),
+        "avg_sentiment": round(aggregated.get(f"{prefix}_avg_sentiment") or 0.0, 4),
     }
 
 def build_sentiment_trend(
@@ -130,58 +170,63 @@ def build_sentiment_trend(
     date_range: str = "30d",
 ) -> List[Dict[str, Optional[float]]]:
     """Return time-series sentiment data for charting."""
+    return _cached_result(
+        "sentiment_trend",
+        {
+            "project_id": project.id,
+            "app_id": app_id,
+            "compare_app_id": compare_app_id,
+            "date_range": date_range,
+            "timestamp": cache.get("last_data_update", 0),
+        },
+        lambda: _compute_sentiment_trend(project, app_id, compare_app_id, date_range),
+    )
+
+
+def _compute_sentiment_trend(
+    project: Project,
+    app_id: str,
+    compare_app_id: Optional[str],
+    date_range: str,
+) -> List[Dict[str, Optional[float]]]:
     horizon = _infer_horizon(date_range)
-    since = timezone.now() - horizon
+    now = timezone.now()
+    since = now - horizon
 
     home_ids = _project_home_ids(project)
     if app_id in home_ids or app_id == project.apple_app_id:
         target_home_ids = home_ids
     else:
         target_home_ids = expand_app_ids(app_id)
-    home_series = _sentiment_series(target_home_ids, since)
 
-    competitor_series = None
-    competitor_ids: List[str] = []
+    groups = {"home": target_home_ids}
     if compare_app_id:
-        competitor_ids = _competitor_app_ids(project, compare_app_id)
-        competitor_series = _sentiment_series(competitor_ids, since)
+        groups["competitor"] = _competitor_app_ids(project, compare_app_id)
+    series = _sentiment_series(groups, since, now)
+    home_series = series["home"]
+    competitor_series = series.get("competitor")
 
-    if not home_series:
-        home_series = _sentiment_series(target_home_ids, None)
-
-    if compare_app_id and competitor_series is not None and not competitor_series:
-        competitor_series = _sentiment_series(competitor_ids, None)
-
-    buckets: Dict[str, SentimentBucket] = {}
-
-    for bucket in home_series:
-        buckets[bucket["label"]] = SentimentBucket(
-            date_label=bucket["label"],
-            positive=bucket["positive"],
-            negative=bucket["negative"],
-        )
+    # Keyed by bucket start so the chart sorts chronologically, not by label.
+    merged: Dict = {}
+    for point in home_series:
+        merged[point["bucket"]] = [point["label"], point["positive"], point["negative"], None]
 
     if competitor_series:
-        for bucket in competitor_series:
-            entry = buckets.setdefault(
-                bucket["label"],
-                SentimentBucket(bucket["label"], positive=0.0, negative=0.0),
-            )
-            entry.competitor = bucket["positive"]
-
-    ordered = sorted(buckets.values(), key=lambda item: item.date_label)
+        for point in competitor_series:
+            entry = merged.setdefault(point["bucket"], [point["label"], 0.0, 0.0, None])
+            entry[3] = point["positive"]
+
     return [
         {
-            "date": item.date_label,
-            "positive": round(item.positive, 1),
-            "negative": round(item.negative, 1),
-            "competitor": round(item.competitor, 1) if item.competitor is not None else None,
+            "date": label,
+            "positive": round(positive, 1),
+            "negative": round(negative, 1),
+            "competitor": round(competitor, 1) if competitor is not None else None,
         }
-        for item in ordered
+        for _, (label, positive, negative, competitor) in sorted(merged.items())
     ]
 
 
-
 def _infer_horizon(date_range: str) -> timedelta:
     mapping = {
         "7d": timedelta(days=7),
@@ -193,42 +238,63 @@ def _infer_horizon(date_range: str) -> timedelta:
     return mapping.get(date_range, timedelta(days=30))
 
 
-def _sentiment_series(app_ids: Iterable[str], since) -> List[Dict[str, float]]:
-    app_ids = [app_id for app_id in set(app_ids) if app_id]
-    if not app_ids:
-        return []
-
-    filters = {
-        'app_id__in': app_ids,
-        'sentiment_score__isnull': False,
-        'counts_toward_score': True,
-        'source': 'Google Play',
-    }
+def _sentiment_series(
+    groups: Dict[str, Iterable[str]], since, now
+) -> Dict[str, List[Dict[str, float]]]:
+    """Bucket sentiment for several app id groups with one grouped query.
 
-    if since is not None:
-        filters['created_at__gte'] = since
+    A group with no reviews inside the window falls back to its full
+    history, matching the chart's previous behaviour.
+    """
+    groups = {name: {app_id for app_id in app_ids if app_id} for name, app_ids in groups.items()}
+    base_queryset = Review.objects.filter(
+        sentiment_score__isnull=False,
+        counts_toward_score=True,
+        source='Google Play',
+    )
 
-    queryset = Review.objects.filter(**filters)
+    series = _bucket_series(base_queryset.filter(created_at__gte=since), groups, _is_daily(since, now))
 
-    if not queryset.exists():
-        if since is None:
-            return []
-        queryset = Review.objects.filter(
-            app_id__in=app_ids,
-            sentiment_score__isnull=False,
-            counts_toward_score=True,
-            source='Google Play',
+    empty_groups = {name: app_ids for name, app_ids in groups.items() if app_ids and not series.get(name)}
+    if empty_groups:
+        # Nothing inside the window: widen each group back to its oldest review.
+        earliest_by_app = dict(
+            base_queryset.filter(app_id__in=set().union(*empty_groups.values()))
+            .values("app_id")
+            .annotate(earliest=Min("created_at"))
+            .values_list("app_id", "earliest")
         )
-        if not queryset.exists():
-            return []
-        since = queryset.order_by('created_at').first().created_at
+        # Groups sharing a bucket granularity are re-run together.
+        fallback: Dict[bool, Dict[str, set]] = {}
+        for name, app_ids in empty_groups.items():
+            stamps = [earliest_by_app[app_id] for app_id in app_ids if app_id in earliest_by_app]
+            if not stamps:
+                continue
+            fallback.setdefault(_is_daily(min(stamps), now), {})[name] = app_ids
+        for daily, subset in fallback.items():
+            series.update(_bucket_series(base_queryset, subset, daily))
+
+    return {name: series.get(name, []) for name in groups}
 
-    horizon = timezone.now() - since if since else timedelta.max
-    truncate = TruncDay("created_at") if horizon <= timedelta(days=30) else TruncWeek("created_at")
 
+def _is_daily(since, now) -> bool:
+    horizon = now - since if since else timedelta.max
+    return horizon <= timedelta(days=30)
+
+
+def _bucket_series(queryset, groups: Dict[str, set], daily: bool) -> Dict[str, List[Dict[str, float]]]:
+    owners: Dict[str, List[str]] = {}
+    for name, app_ids in groups.items():
+        for app_id in app_ids:
+            owners.setdefault(app_id, []).append(name)
+    if not owners:
+        return {}
+
+    truncate = TruncDay("created_at") if daily else TruncWeek("created_at")
     aggregated = (
-        queryset.annotate(bucket=truncate)
-        .values("bucket")
+        queryset.filter(app_id__in=list(owners))
+        .annotate(bucket=truncate)
+        .values("app_id", "bucket")
         .annotate(
             total=Count("id"),
             positive=Count("id", filter=Q(sentiment_score__gt=0.1)),
@@ -236,17 +302,32 @@ def _sentiment_series(app_ids: Iterable[str], since) -> List[Dict[str, float]]:
         )
         .order_by("bucket")
     )
+    if connection.vendor == "postgresql":
+        # Format the chart label in SQL; other backends fall back to strftime.
+        aggregated = aggregated.annotate(
+            label=Func(F("bucket"), Value("Mon DD"), function="TO_CHAR", output_field=CharField())
+        )
 
-    results: List[Dict[str, float]] = []
+    counts: Dict[str, Dict] = {}
     for row in aggregated:
-        total = row["total"] or 1
-        label = row["bucket"].strftime("%b %d")
-        results.append(
+        for name in owners[row["app_id"]]:
+            totals = counts.setdefault(name, {}).get(row["bucket"])
+            if totals is None:
+                label = row.get("label") or row["bucket"].strftime("%b %d")
+                totals = counts[name][row["bucket"]] = [label, 0, 0, 0]
+            totals[1] += row["total"]
+            totals[2] += row["positive"]
+            totals[3] += row["negative"]
+
+    results: Dict[str, List[Dict[str, float]]] = {}
+    for name, buckets in counts.items():
+        results[name] = [
             {
+                "bucket": bucket,
                 "label": label,
-                "positive": (row["positive"] / total) * 100.0,
-                "negative": (row["negative"] / total) * 100.0,
+                "positive": (positive / (total or 1)) * 100.0,
+                "negative": (negative / (total or 1)) * 100.0,
             }
-        )
+            for bucket, (label, total, positive, negative) in buckets.items()
+        ]
     return results
-
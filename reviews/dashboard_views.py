@@ -3,7 +3,10 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
+from concurrent.futures import ThreadPoolExecutor
+
 from django.conf import settings
+from django.db import connection
 
 from .dashboard_services import build_sentiment_trend, calculate_strategic_scores
 from .models import Project
@@ -31,9 +34,15 @@ def project_sentiment_trends(request, project_id):
     except Project.DoesNotExist:
         return Response({"error": "Project not found"}, status=status.HTTP_404_NOT_FOUND)
 
-    app_id_param = request.query_params.get("app_id")
-    compare_to_param = request.query_params.get("compare_to")
-    date_range = request.query_params.get("date_range", "30d")
+    data = build_sentiment_trend(project, *_trend_arguments(project, request.query_params))
+    return Response({"series": data})
+
+
+def _trend_arguments(project, query_params):
+    """Resolve the sentiment trend query parameters against *project*."""
+    app_id_param = query_params.get("app_id")
+    compare_to_param = query_params.get("compare_to")
+    date_range = query_params.get("date_range", "30d")
 
     if not app_id_param or app_id_param in {"home", project.home_app_id, project.apple_app_id}:
         target_app_id = project.home_app_id
@@ -46,8 +55,39 @@ def project_sentiment_trends(request, project_id):
     if compare_to_param and compare_to_param not in {"home"}:
         compare_to = compare_to_param
 
-    data = build_sentiment_trend(project, target_app_id, compare_to, date_range)
-    return Response({"series": data})
+    return target_app_id, compare_to, date_range
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def project_dashboard_bundle(request, project_id):
+    """Return strategic scores, sentiment trend and strengths in one response.
+
+    Accepts the same ``app_id``/``compare_to``/``date_range`` parameters as the
+    sentiment trend endpoint; strengths are computed for the project's home app.
+    """
+    try:
+        project = Project.objects.get(id=project_id, user=request.user)
+    except Project.DoesNotExist:
+        return Response({"error": "Project not found"}, status=status.HTTP_404_NOT_FOUND)
+
+    # Topic modelling is the slow part; run it alongside the score and trend
+    # queries rather than after them.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        strengths_future = executor.submit(_threaded_strengths_payload, project.home_app_id)
+        scores = calculate_strategic_scores(project)
+        series = build_sentiment_trend(project, *_trend_arguments(project, request.query_params))
+        strengths = strengths_future.result()
+
+    return Response({"scores": scores, "series": series, "strengths": strengths})
+
+
+def _threaded_strengths_payload(app_id):
+    try:
+        return _strengths_payload(app_id)
+    finally:
+        # Worker threads get their own connection; don't leave it open
+        connection.close()
 
 
 @api_view(["GET"])
@@ -57,6 +97,10 @@ def strengths_insights(request):
     if not app_id:
         return Response({"error": "The 'app_id' query parameter is required."}, status=status.HTTP_400_BAD_REQUEST)
 
+    return Response(_strengths_payload(app_id))
+
+
+def _strengths_payload(app_id):
     related_app_ids = expand_app_ids(app_id)
     lda_results = analyze_app_topics(app_id, sentiment_filter="positive")
     topics_for_display = lda_results.get("distinct_topics") or lda_results.get("topics", [])
@@ -93,4 +137,4 @@ def strengths_insights(request):
     if lda_results.get("error"):
         response_payload["error"] = lda_results["error"]
 
-    return Response(response_payload)
+    return response_payload
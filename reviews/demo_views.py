@@ -1,20 +1,27 @@
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
-from datetime import datetime, timedelta
+from datetime import date, timedelta
+from functools import lru_cache
 
 
 @api_view(['GET'])
 @permission_classes([AllowAny])
 def demo_dashboard(request):
-    base_date = datetime.now() - timedelta(weeks=8)
+    return Response(_demo_payload(date.today()))
+
+
+@lru_cache(maxsize=1)
+def _demo_payload(today):
+    """Build the static demo payload; cached until the date rolls over."""
+    base_date = today - timedelta(weeks=8)
 
     # Generate 8 weeks of sentiment data for Momentum (improving trend)
     momentum_series = []
     for week in range(8):
-        date = base_date + timedelta(weeks=week)
+        week_date = base_date + timedelta(weeks=week)
         momentum_series.append({
-            'date': date.strftime('%b %d'),
+            'date': week_date.strftime('%b %d'),
             'positive': 58 + (week * 2),  # Improves from 58% to 72%
             'negative': 25 - (week * 1),  # Decreases from 25% to 18%
             'competitor': 52  # TaskFlow comparison line
@@ -23,9 +30,9 @@ def demo_dashboard(request):
     # Generate 8 weeks of sentiment data for TaskFlow (flat performance)
     taskflow_series = []
     for week in range(8):
-        date = base_date + timedelta(weeks=week)
+        week_date = base_date + timedelta(weeks=week)
         taskflow_series.append({
-            'date': date.strftime('%b %d'),
+            'date': week_date.strftime('%b %d'),
             'positive': 52,  # Stays flat at 52%
             'negative': 32,  # Stays flat at 32%
             'competitor': None
@@ -41,7 +48,7 @@ def demo_dashboard(request):
         'created_at': '2024-01-01T00:00:00Z'
     }
 
-    return Response({
+    return {
         'projects': [demo_project],
         'user_limits': {
             'project_limit': 3,
@@ -229,4 +236,4 @@ def demo_dashboard(request):
         },
         'default_project_id': 1,
         'default_app_id': 'com.momentum.app'
-    })
\ No newline at end of file
+    }
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.6 on 2026-10-15 22:39
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0014_competitorapp_apple_app_id_project_apple_app_id_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='competitorapp',
+            index=models.Index(fields=['app_id'], include=('apple_app_id',), name='competitor_app_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='competitorapp',
+            index=models.Index(fields=['apple_app_id'], include=('app_id',), name='competitor_apple_app_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['home_app_id'], include=('apple_app_id',), name='project_home_app_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['apple_app_id'], include=('home_app_id',), name='project_apple_app_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.6 on 2026-10-15 22:46
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # Build the index without locking reviews_review against writes
+    atomic = False
+
+    dependencies = [
+        ('reviews', '0015_project_competitor_app_id_indexes'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='review',
+            index=models.Index(fields=['app_id'], name='review_app_id_idx'),
+        ),
+    ]
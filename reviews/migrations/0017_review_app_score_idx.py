@@ -0,0 +1,29 @@
+# Generated by Django 5.2.6 on 2026-10-15 23:40
+
+from django.contrib.postgres.operations import AddIndexConcurrently, RemoveIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # Swap the indexes without locking reviews_review against writes
+    atomic = False
+
+    dependencies = [
+        ('reviews', '0016_review_app_id_idx'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='review',
+            index=models.Index(
+                fields=['app_id', 'counts_toward_score', 'sentiment_score', 'created_at'],
+                include=['source'],
+                name='review_app_score_idx',
+            ),
+        ),
+        RemoveIndexConcurrently(
+            model_name='review',
+            name='review_app_id_idx',
+        ),
+    ]
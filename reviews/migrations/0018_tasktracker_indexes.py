@@ -0,0 +1,27 @@
+# Generated by Django 5.2.6 on 2026-10-15 23:48
+
+from django.conf import settings
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # Build the indexes without locking reviews_tasktracker against writes
+    atomic = False
+
+    dependencies = [
+        ('reviews', '0017_review_app_score_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='tasktracker',
+            index=models.Index(condition=models.Q(('status__in', ['pending', 'started', 'progress'])), fields=['user', 'app_id'], name='tasktracker_active_app_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='tasktracker',
+            index=models.Index(fields=['user', 'status', '-created_at'], name='tasktracker_user_status_idx'),
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 5.2.6 on 2026-10-16 00:05
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def check_duplicate_competitors(apps, schema_editor):
+    """Refuse to add the constraint while duplicate (project, app_id) rows exist.
+
+    Competitor rows are user data, so they are listed for an operator to
+    resolve rather than deleted here.
+    """
+    CompetitorApp = apps.get_model('reviews', 'CompetitorApp')
+    duplicates = (
+        CompetitorApp.objects.values('project_id', 'app_id')
+        .annotate(rows=Count('id'))
+        .filter(rows__gt=1)
+        .order_by('project_id', 'app_id')
+    )
+    conflicts = []
+    for row in duplicates:
+        ids = list(
+            CompetitorApp.objects.filter(project_id=row['project_id'], app_id=row['app_id'])
+            .order_by('id')
+            .values_list('id', flat=True)
+        )
+        conflicts.append(f"project_id={row['project_id']} app_id={row['app_id']} ids={ids}")
+    if conflicts:
+        raise RuntimeError(
+            "Duplicate competitor apps must be removed before "
+            "competitor_project_app_uniq can be added:\n  " + "\n  ".join(conflicts)
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0018_tasktracker_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(check_duplicate_competitors, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='competitorapp',
+            constraint=models.UniqueConstraint(fields=('project', 'app_id'), name='competitor_project_app_uniq'),
+        ),
+    ]
@@ -1,5 +1,8 @@
+import time
+
 from django.db import models
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.utils import timezone
 
 
@@ -23,6 +26,17 @@ class Review(models.Model):
                                         help_text="Sentiment score from -1 (negative) to 1 (positive)")
     created_at = models.DateTimeField(default=timezone.now, db_index=True)
 
+    class Meta:
+        indexes = [
+            # Covers the dashboard sentiment aggregates; app_id leads, so it
+            # also serves plain app_id lookups.
+            models.Index(
+                fields=['app_id', 'counts_toward_score', 'sentiment_score', 'created_at'],
+                include=['source'],
+                name='review_app_score_idx',
+            ),
+        ]
+
     def __str__(self):
         return f"{self.source} - {self.title}"
 
@@ -30,6 +44,29 @@ class Review(models.Model):
 
 # Add these new models:
 
+# Per-tier subscription limits, keyed by UserProfile.subscription_tier.
+PROJECT_LIMITS = {
+    'free': 1,
+    'starter': 1,
+    'pro': 5,
+    'enterprise': 999
+}
+
+REVIEW_COLLECTION_LIMITS = {
+    'free': 500,        # Free tier: 500 reviews max per app
+    'starter': 1000,    # Starter tier: 1000 reviews max per app (paid)
+    'pro': 1000,        # Pro tier: 1000 reviews max per app (paid)
+    'enterprise': 1000  # Enterprise: 1000 reviews max per app (paid)
+}
+
+COMPETITOR_LIMITS = {
+    'free': 1,
+    'starter': 3,
+    'pro': 5,
+    'enterprise': None  # Enterprise tier has no enforced limit
+}
+
+
 class UserProfile(models.Model):
     SUBSCRIPTION_CHOICES = [
         ('free', 'Free'),
@@ -43,35 +80,25 @@ class UserProfile(models.Model):
     projects_created = models.IntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    @classmethod
+    def for_user(cls, user):
+        """Return the profile for *user*, reusing a select_related copy and creating one if missing."""
+        try:
+            return user.userprofile
+        except cls.DoesNotExist:
+            return cls.objects.get_or_create(user=user)[0]
+
     def get_project_limit(self):
-        limits = {
-            'free': 1,
-            'starter': 1,
-            'pro': 5,
-            'enterprise': 999
-        }
-        return limits.get(self.subscription_tier, 1)
+        return PROJECT_LIMITS.get(self.subscription_tier, 1)
 
 
     def get_review_collection_limit(self):
         """Get the maximum reviews that can be collected per app for this subscription tier"""
-        limits = {
-            'free': 500,        # Free tier: 500 reviews max per app
-            'starter': 1000,    # Starter tier: 1000 reviews max per app (paid)
-            'pro': 1000,        # Pro tier: 1000 reviews max per app (paid)
-            'enterprise': 1000  # Enterprise: 1000 reviews max per app (paid)
-        }
-        return limits.get(self.subscription_tier, 500)
+        return REVIEW_COLLECTION_LIMITS.get(self.subscription_tier, 500)
 
     def get_competitor_limit(self):
         """Get how many competitor apps the user can track per project for this tier."""
-        limits = {
-            'free': 1,
-            'starter': 3,
-            'pro': 5,
-            'enterprise': None  # Enterprise tier has no enforced limit
-        }
-        return limits.get(self.subscription_tier, 1)
+        return COMPETITOR_LIMITS.get(self.subscription_tier, 1)
 
 
 class Project(models.Model):
@@ -89,26 +116,41 @@ class Project(models.Model):
     home_app_last_refreshed = models.DateTimeField(null=True, blank=True,
                                                    help_text="When reviews were last fetched for the home app")
 
+    class Meta:
+        indexes = [
+            # Cover both branches of the home/apple id lookup in expand_app_ids
+            models.Index(fields=['home_app_id'], include=['apple_app_id'], name='project_home_app_idx'),
+            models.Index(fields=['apple_app_id'], include=['home_app_id'], name='project_apple_app_idx'),
+        ]
+
     def __str__(self):
         return f"{self.name} - {self.user.username}"
 
     def needs_refresh(self, app_id=None):
         """Check if app data needs refresh (older than 24 hours)"""
-        from datetime import datetime, timezone, timedelta
-
-        if app_id == self.home_app_id:
-            last_refreshed = self.home_app_last_refreshed
-        else:
-            # Check competitor apps
-            competitor = self.competitors.filter(app_id=app_id).first()
-            last_refreshed = competitor.last_refreshed if competitor else None
+        return self.needs_refresh_map([app_id])[app_id]
 
-        if not last_refreshed:
-            return True  # Never refreshed, needs refresh
+    def needs_refresh_map(self, app_ids):
+        """Map each of *app_ids* to whether its data needs refresh, in at most one query."""
+        from datetime import datetime, timezone, timedelta
 
-        # Refresh if data is older than 24 hours
+        competitor_ids = [app_id for app_id in app_ids if app_id != self.home_app_id]
+        last_refreshed = {}
+        if competitor_ids:
+            # Keep the first competitor per app_id, as a filter().first() lookup would
+            for app_id, refreshed in self.competitors.filter(
+                app_id__in=competitor_ids
+            ).order_by('-pk').values_list('app_id', 'last_refreshed'):
+                last_refreshed[app_id] = refreshed
+        last_refreshed[self.home_app_id] = self.home_app_last_refreshed
+
+        # Refresh if never refreshed or data is older than 24 hours
         cutoff = datetime.now(timezone.utc) - timedelta(hours=24)
-        return last_refreshed < cutoff
+        result = {}
+        for app_id in app_ids:
+            refreshed = last_refreshed.get(app_id)
+            result[app_id] = not refreshed or refreshed < cutoff
+        return result
 
 
 class CompetitorApp(models.Model):
@@ -125,10 +167,28 @@ class CompetitorApp(models.Model):
     last_refreshed = models.DateTimeField(null=True, blank=True,
                                          help_text="When reviews were last fetched for this competitor app")
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['app_id'], include=['apple_app_id'], name='competitor_app_idx'),
+            models.Index(fields=['apple_app_id'], include=['app_id'], name='competitor_apple_app_idx'),
+        ]
+        constraints = [
+            # One row per app in a project; also the index behind (project, app_id) lookups
+            models.UniqueConstraint(fields=['project', 'app_id'], name='competitor_project_app_uniq'),
+        ]
+
     def __str__(self):
         return f"{self.app_name} (competitor of {self.project.name})"
 
 
+# How long in-flight task progress stays in cache without an update
+TASK_PROGRESS_CACHE_TIMEOUT = 3600
+
+# Minimum seconds between database writes of in-flight progress, so the row
+# stays close to the cached value if that is evicted or expires
+TASK_PROGRESS_DB_INTERVAL = 30
+
+
 class TaskTracker(models.Model):
     """Track all analysis tasks for reliable progressive disclosure"""
     TASK_TYPES = [
@@ -184,20 +244,74 @@ class TaskTracker(models.Model):
         self.current_reviews = current_reviews
         if target_reviews:
             self.target_reviews = target_reviews
-        self.progress_percent = min(100.0, (current_reviews / self.target_reviews) * 100)
+        if current_reviews >= self.target_reviews:
+            self.progress_percent = 100.0
+        else:
+            self.progress_percent = current_reviews * 100.0 / self.target_reviews
         self.status = status
 
+        update_fields = ['current_reviews', 'target_reviews', 'progress_percent', 'status']
+        if status == 'progress':
+            # Every tick goes to cache, which readers overlay via
+            # apply_cached_progress; the row is only refreshed periodically
+            cache.set(self.progress_cache_key(self.task_id), {
+                'status': status,
+                'current_reviews': self.current_reviews,
+                'target_reviews': self.target_reviews,
+                'progress_percent': self.progress_percent,
+            }, TASK_PROGRESS_CACHE_TIMEOUT)
+            saved_at = getattr(self, '_progress_saved_at', None)
+            if saved_at is None or time.monotonic() - saved_at >= TASK_PROGRESS_DB_INTERVAL:
+                self.save(update_fields=update_fields)
+                self._progress_saved_at = time.monotonic()
+            return
+
         if status == 'started' and not self.started_at:
-            from django.utils import timezone
             self.started_at = timezone.now()
-        elif status in ['success', 'failure', 'revoked'] and not self.completed_at:
-            from django.utils import timezone
-            self.completed_at = timezone.now()
-
-        self.save()
+            update_fields.append('started_at')
+        elif status in ['success', 'failure', 'revoked']:
+            # Terminal write: persist any result/error text set by the caller
+            # in the same UPDATE
+            update_fields += ['result_message', 'error_message']
+            if not self.completed_at:
+                self.completed_at = timezone.now()
+                update_fields.append('completed_at')
+
+        self.save(update_fields=update_fields)
+        self._progress_saved_at = time.monotonic()
+        cache.delete(self.progress_cache_key(self.task_id))
+
+    @staticmethod
+    def progress_cache_key(task_id):
+        return f"task_progress_{task_id}"
+
+    @classmethod
+    def cached_progress(cls, task_ids):
+        """Return in-flight progress for *task_ids* from cache, keyed by task id."""
+        keys = {cls.progress_cache_key(task_id): task_id for task_id in task_ids}
+        return {keys[key]: progress for key, progress in cache.get_many(list(keys)).items()}
+
+    def apply_cached_progress(self, progress=None):
+        """Overlay cached in-flight progress onto this tracker; looks it up if not given."""
+        if progress is None:
+            progress = cache.get(self.progress_cache_key(self.task_id))
+        if progress:
+            for field, value in progress.items():
+                setattr(self, field, value)
+        return self
 
     def __str__(self):
         return f"{self.task_type} - {self.app_name} ({self.status})"
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # Active-task lookups by app and by user (status views, duplicate checks);
+            # the per-app index only holds in-flight rows, so it stays small
+            models.Index(
+                fields=['user', 'app_id'],
+                condition=models.Q(status__in=['pending', 'started', 'progress']),
+                name='tasktracker_active_app_idx',
+            ),
+            models.Index(fields=['user', 'status', '-created_at'], name='tasktracker_user_status_idx'),
+        ]
@@ -2,7 +2,9 @@ from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
-from django.db import transaction
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import Count
 from .models import Project, CompetitorApp, UserProfile, Review, TaskTracker
 from .tasks import (
     import_google_play_reviews_for_user,
@@ -11,6 +13,9 @@ from .tasks import (
 )
 from celery.result import AsyncResult
 
+# Finished task results never change, so polls after completion are served
+# from cache instead of the Celery result backend
+TASK_RESULT_CACHE_TIMEOUT = 3600
 
 
 @api_view(['POST'])
@@ -35,12 +40,14 @@ def create_project(request):
         }, status=status.HTTP_400_BAD_REQUEST)
 
     # Get user profile and check project limits
-    profile = UserProfile.objects.get_or_create(user=request.user)[0]
+    profile = UserProfile.for_user(request.user)
     user_projects_count = Project.objects.filter(user=request.user).count()
 
-    if user_projects_count >= profile.get_project_limit():
+    project_limit = profile.get_project_limit()
+
+    if user_projects_count >= project_limit:
         return Response({
-            'error': f'Project limit reached. Your {profile.subscription_tier} plan allows {profile.get_project_limit()} project(s)'
+            'error': f'Project limit reached. Your {profile.subscription_tier} plan allows {project_limit} project(s)'
         }, status=status.HTTP_403_FORBIDDEN)
 
     # Check if project name already exists for this user
@@ -131,23 +138,23 @@ def list_projects(request):
     """
     List all projects for the authenticated user
     """
-    projects = Project.objects.filter(user=request.user).order_by('-created_at')
-
-    projects_data = []
-    for project in projects:
-        competitors_count = project.competitors.count()
-        projects_data.append({
-            'id': project.id,
-            'name': project.name,
-            'home_app_id': project.home_app_id,
-            'home_app_name': project.home_app_name,
-            'apple_app_id': project.apple_app_id,
-            'created_at': project.created_at,
-            'competitors_count': competitors_count
-        })
+    projects_data = list(
+        Project.objects.filter(user=request.user)
+        .annotate(competitors_count=Count('competitors'))
+        .order_by('-created_at')
+        .values(
+            'id',
+            'name',
+            'home_app_id',
+            'home_app_name',
+            'apple_app_id',
+            'created_at',
+            'competitors_count',
+        )
+    )
 
     # Also include user limits for frontend
-    profile = UserProfile.objects.get_or_create(user=request.user)[0]
+    profile = UserProfile.for_user(request.user)
 
     return Response({
         'projects': projects_data,
@@ -192,7 +199,7 @@ def add_competitor(request):
         }, status=status.HTTP_404_NOT_FOUND)
 
     # Note: No longer limiting competitor count, usage-based limits apply to analysis requests
-    profile = UserProfile.objects.get_or_create(user=request.user)[0]
+    profile = UserProfile.for_user(request.user)
 
     # Check if competitor already exists in this project
     if CompetitorApp.objects.filter(project=project, app_id=app_id).exists():
@@ -205,13 +212,19 @@ def add_competitor(request):
             'error': 'This Apple app is already a competitor in this project'
         }, status=status.HTTP_400_BAD_REQUEST)
 
-    # Create the competitor
-    competitor = CompetitorApp.objects.create(
-        project=project,
-        app_id=app_id,
-        apple_app_id=apple_app_id,
-        app_name=app_name
-    )
+    # Create the competitor; the unique constraint settles concurrent adds
+    try:
+        with transaction.atomic():
+            competitor = CompetitorApp.objects.create(
+                project=project,
+                app_id=app_id,
+                apple_app_id=apple_app_id,
+                app_name=app_name
+            )
+    except IntegrityError:
+        return Response({
+            'error': 'This app is already a competitor in this project'
+        }, status=status.HTTP_400_BAD_REQUEST)
 
     google_task_id = None
     google_import_status = "pending"
@@ -283,30 +296,21 @@ def get_project_details(request, project_id):
     """
     Get detailed information about a specific project including competitors
     """
-    try:
-        project = Project.objects.get(id=project_id, user=request.user)
-    except Project.DoesNotExist:
+    project_data = Project.objects.filter(id=project_id, user=request.user).values(
+        'id', 'name', 'home_app_id', 'home_app_name', 'created_at'
+    ).first()
+    if project_data is None:
         return Response({
             'error': 'Project not found or you do not have permission to view it'
         }, status=status.HTTP_404_NOT_FOUND)
 
-    competitors = CompetitorApp.objects.filter(project=project).order_by('-added_at')
-    competitors_data = [{
-        'id': comp.id,
-        'app_id': comp.app_id,
-        'apple_app_id': comp.apple_app_id,
-        'app_name': comp.app_name,
-        'added_at': comp.added_at
-    } for comp in competitors]
+    project_data['competitors'] = list(
+        CompetitorApp.objects.filter(project_id=project_data['id'])
+        .order_by('-added_at')
+        .values('id', 'app_id', 'apple_app_id', 'app_name', 'added_at')
+    )
 
-    return Response({
-        'id': project.id,
-        'name': project.name,
-        'home_app_id': project.home_app_id,
-        'home_app_name': project.home_app_name,
-        'created_at': project.created_at,
-        'competitors': competitors_data
-    })
+    return Response(project_data)
 
 
 @api_view(['DELETE'])
@@ -315,18 +319,15 @@ def delete_project(request, project_id):
     """
     Delete a project and cascade associated competitor data for the authenticated user.
     """
-    try:
-        project = Project.objects.get(id=project_id, user=request.user)
-    except Project.DoesNotExist:
+    # Competitors and task trackers cascade from the project in the same
+    # atomic delete. Reviews are keyed by app_id and may be shared with other
+    # projects, so they are kept.
+    deleted, _ = Project.objects.filter(id=project_id, user=request.user).delete()
+    if not deleted:
         return Response({
             'error': 'Project not found or you do not have permission to delete it'
         }, status=status.HTTP_404_NOT_FOUND)
 
-    with transaction.atomic():
-        project.tasktracker_set.all().delete()
-        project.competitors.all().delete()
-        project.delete()
-
     remaining_projects = Project.objects.filter(user=request.user).count()
 
     return Response({
@@ -341,19 +342,17 @@ def delete_competitor(request, competitor_id):
     """
     Remove a competitor from a project
     """
-    try:
-        competitor = CompetitorApp.objects.get(
-            id=competitor_id,
-            project__user=request.user
-        )
-        competitor.delete()
+    deleted, _ = CompetitorApp.objects.filter(
+        id=competitor_id,
+        project__user=request.user
+    ).delete()
+    if deleted:
         return Response({
             'message': 'Competitor removed successfully'
         }, status=status.HTTP_200_OK)
-    except CompetitorApp.DoesNotExist:
-        return Response({
-            'error': 'Competitor not found or you do not have permission to delete it'
-        }, status=status.HTTP_404_NOT_FOUND)
+    return Response({
+        'error': 'Competitor not found or you do not have permission to delete it'
+    }, status=status.HTTP_404_NOT_FOUND)
 
 
 @api_view(['GET'])
@@ -362,6 +361,26 @@ def task_status(request, task_id):
     """
     Check the status of a background task (like review import)
     """
+    # Scoped to the user, like the tracker lookup below
+    cache_key = f"task_result_{request.user.id}_{task_id}"
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return Response(cached)
+
+    # A tracker that recorded success already holds the task's return value
+    result_message = TaskTracker.objects.filter(
+        task_id=task_id, user=request.user, status='success'
+    ).exclude(result_message='').values_list('result_message', flat=True).first()
+    if result_message is not None:
+        response_data = {
+            'task_id': task_id,
+            'status': 'SUCCESS',
+            'ready': True,
+            'result': result_message,
+        }
+        cache.set(cache_key, response_data, TASK_RESULT_CACHE_TIMEOUT)
+        return Response(response_data)
+
     try:
         result = AsyncResult(task_id)
 
@@ -371,11 +390,12 @@ def task_status(request, task_id):
             'ready': result.ready()
         }
 
-        if result.ready():
+        if response_data['ready']:
             if result.successful():
                 response_data['result'] = result.result
             else:
                 response_data['error'] = str(result.result)
+            cache.set(cache_key, response_data, TASK_RESULT_CACHE_TIMEOUT)
         else:
             response_data['info'] = result.info
 
@@ -402,28 +422,22 @@ def upgrade_to_full_analysis(request):
         }, status=status.HTTP_400_BAD_REQUEST)
 
     # Verify the user has access to this app through their projects
-    user_projects = Project.objects.filter(user=request.user)
-    has_access = False
-
-    for project in user_projects:
-        if project.home_app_id == app_id:
-            has_access = True
-            app_name = project.home_app_name
-            break
-        competitor = CompetitorApp.objects.filter(project=project, app_id=app_id).first()
-        if competitor:
-            has_access = True
-            app_name = competitor.app_name
-            break
-
-    if not has_access:
+    app_name = Project.objects.filter(
+        user=request.user, home_app_id=app_id
+    ).values_list('home_app_name', flat=True).first()
+    if app_name is None:
+        app_name = CompetitorApp.objects.filter(
+            project__user=request.user, app_id=app_id
+        ).values_list('app_name', flat=True).first()
+
+    if app_name is None:
         return Response({
             'error': 'You do not have access to this app'
         }, status=status.HTTP_403_FORBIDDEN)
 
     try:
         # Get user profile for subscription tier
-        profile = UserProfile.objects.get_or_create(user=request.user)[0]
+        profile = UserProfile.for_user(request.user)
 
         # Trigger full analysis task
         task_result = import_google_play_reviews_full_analysis(
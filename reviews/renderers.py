@@ -0,0 +1,28 @@
+"""DRF renderers for the reviews API."""
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+_ENCODER = JSONEncoder()
+
+
+class ORJSONRenderer(JSONRenderer):
+    """JSON renderer backed by orjson.
+
+    Output matches DRF's JSONRenderer for the payloads this API returns:
+    UTC datetimes end in ``Z`` and integer keys (competitor ids) become
+    strings. Types orjson does not handle natively, such as ``Decimal`` and
+    lazy translation strings, fall back to DRF's encoder.
+    """
+
+    options = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        options = self.options
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            options |= orjson.OPT_INDENT_2
+
+        return orjson.dumps(data, default=_ENCODER.default, option=options)
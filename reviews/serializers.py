@@ -5,4 +5,7 @@ from .models import Review
 class ReviewSerializer(serializers.ModelSerializer):
     class Meta:
         model = Review
-        fields = '__all__' # This will include all fields from your Review model
\ No newline at end of file
+        fields = (
+            'id', 'app_id', 'review_id', 'source', 'counts_toward_score', 'author',
+            'rating', 'title', 'content', 'sentiment_score', 'created_at',
+        )
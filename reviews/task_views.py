@@ -1,12 +1,29 @@
 # New task-centric API for reliable progressive disclosure
+import hashlib
+import json
+from itertools import chain
+
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Q, Count, OuterRef, Subquery
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from .models import TaskTracker, Project, CompetitorApp, UserProfile, Review
-from .app_id_utils import expand_many_app_ids
+from .app_id_utils import EXPAND_CACHE_VERSION_KEY, expand_app_id_map
 from .tasks import import_google_play_reviews_for_user
-from django.db.models import Q, Count, Avg
+
+ACTIVE_TASK_STATUSES = ['pending', 'started', 'progress']
+
+# The cache key already follows tracker/review/competitor changes; the TTLs
+# just bound staleness for anything the signature misses, tighter while tasks
+# are running
+ANALYSIS_STATUS_ACTIVE_TIMEOUT = 5
+ANALYSIS_STATUS_IDLE_TIMEOUT = 60
+
+# Upper bound on how long a crashed submission can hold its start lock
+START_ANALYSIS_LOCK_TIMEOUT = 60
 
 
 @api_view(['GET'])
@@ -18,13 +35,52 @@ def project_analysis_status(request, project_id):
     except Project.DoesNotExist:
         return Response({'error': 'Project not found'}, status=status.HTTP_404_NOT_FOUND)
 
-    profile = UserProfile.objects.get_or_create(user=request.user)[0]
+    profile = UserProfile.for_user(request.user)
+
+    # The frontend polls this endpoint while tasks run; serve repeat polls
+    # from cache until a tracker moves, reviews land or competitors change.
+    # Trackers come from the database; their latest progress from the shared cache.
+    active_trackers = list(TaskTracker.objects.filter(
+        user=request.user,
+        status__in=ACTIVE_TASK_STATUSES,
+    ).values_list('task_id', 'status', 'current_reviews'))
+    progress = TaskTracker.cached_progress([task_id for task_id, _, _ in active_trackers])
+    cache_key_data = {
+        'project_id': project.id,
+        'user_id': request.user.id,
+        'tier': profile.subscription_tier,
+        'timestamp': cache.get(f'last_project_update_{project.id}', 0),
+        'id_version': cache.get(EXPAND_CACHE_VERSION_KEY, 0),
+        'trackers': active_trackers,
+        'progress': progress,
+    }
+    cache_key = f"analysis_status_{hashlib.md5(json.dumps(cache_key_data, sort_keys=True).encode()).hexdigest()}"
+    result = cache.get(cache_key)
+    if result is None:
+        result = _analysis_status_payload(request.user, project, profile, progress)
+        timeout = ANALYSIS_STATUS_ACTIVE_TIMEOUT if result['has_active_tasks'] else ANALYSIS_STATUS_IDLE_TIMEOUT
+        cache.set(cache_key, result, timeout)
+    return Response(result)
+
+
+def _analysis_status_payload(user, project, profile, progress):
     review_limit = profile.get_review_collection_limit()
 
-    competitors = list(CompetitorApp.objects.filter(project=project))
+    competitors = list(CompetitorApp.objects.filter(project=project).only(
+        'id', 'app_id', 'apple_app_id', 'app_name', 'added_at'
+    ))
+
+    # Expand every identifier in the project with one cache round trip
+    expanded = expand_app_id_map(chain(
+        [project.home_app_id, project.apple_app_id],
+        chain.from_iterable((competitor.app_id, competitor.apple_app_id) for competitor in competitors),
+    ))
+
+    def combined_ids(*identifiers):
+        return sorted({value for identifier in identifiers if identifier for value in expanded[identifier]})
 
     entries = []
-    home_app_ids = expand_many_app_ids([project.home_app_id, project.apple_app_id])
+    home_app_ids = combined_ids(project.home_app_id, project.apple_app_id)
     entries.append({
         'key': project.home_app_id,
         'name': project.home_app_name,
@@ -34,7 +90,7 @@ def project_analysis_status(request, project_id):
     })
 
     for competitor in competitors:
-        competitor_ids = expand_many_app_ids([competitor.app_id, competitor.apple_app_id])
+        competitor_ids = combined_ids(competitor.app_id, competitor.apple_app_id)
         entries.append({
             'key': competitor.app_id,
             'name': competitor.app_name,
@@ -45,50 +101,66 @@ def project_analysis_status(request, project_id):
 
     task_app_ids = {identifier for entry in entries for identifier in entry['app_ids']}
 
-    active_tasks = list(TaskTracker.objects.filter(
+    active_tasks = TaskTracker.objects.filter(
         app_id__in=task_app_ids,
-        user=request.user,
-        status__in=['pending', 'started', 'progress'],
-    ).order_by('-created_at'))
+        user=user,
+        status__in=ACTIVE_TASK_STATUSES,
+    ).only(
+        'task_id', 'app_id', 'task_type', 'status', 'current_reviews',
+        'target_reviews', 'progress_percent', 'created_at',
+    )
+    if connection.vendor == 'postgresql':
+        # DISTINCT ON returns only the newest active task per app
+        active_tasks = active_tasks.order_by('app_id', '-created_at').distinct('app_id')
+    else:
+        active_tasks = active_tasks.order_by('-created_at')
 
     latest_task_by_app = {}
     for task in active_tasks:
+        task.apply_cached_progress(progress.get(task.task_id, {}))
         latest_task_by_app.setdefault(task.app_id, task)
 
-    apps_data = {}
-    task_data = []
-
-    for entry in entries:
-        app_ids = entry['app_ids']
-        stats = Review.objects.filter(
-            app_id__in=app_ids,
+    # One grouped query for every app in the project; entries sum their rows
+    counts_by_app = {
+        row['app_id']: (row['total'], row['positive'], row['negative'])
+        for row in Review.objects.filter(
+            app_id__in=task_app_ids,
             sentiment_score__isnull=False,
             counts_toward_score=True,
-        ).aggregate(
+        ).values('app_id').annotate(
             total=Count('id'),
             positive=Count('id', filter=Q(sentiment_score__gt=0.1)),
             negative=Count('id', filter=Q(sentiment_score__lt=-0.1)),
-            avg_sentiment=Avg('sentiment_score'),
         )
+    }
+
+    apps_data = {}
+    task_data = []
 
-        total = stats['total'] or 0
-        positive = stats['positive'] or 0
-        negative = stats['negative'] or 0
+    for entry in entries:
+        app_ids = entry['app_ids']
+        total = positive = negative = 0
+        for identifier in app_ids:
+            app_total, app_positive, app_negative = counts_by_app.get(identifier, (0, 0, 0))
+            total += app_total
+            positive += app_positive
+            negative += app_negative
         neutral = max(total - positive - negative, 0)
+        scale = 100.0 / total if total > 0 else 0
 
         competitor_obj = entry['competitor']
         app_payload = {
             'app_name': entry['name'],
             'app_type': entry['type'],
             'competitor_id': competitor_obj.id if competitor_obj else None,
-            'added_at': competitor_obj.added_at.isoformat() if competitor_obj else None,
+            'added_at': competitor_obj.added_at if competitor_obj else None,
             'total_reviews': total,
             'positive_count': positive,
             'negative_count': negative,
             'neutral_count': neutral,
-            'positive_percentage': round((positive / total * 100), 1) if total > 0 else 0,
-            'negative_percentage': round((negative / total * 100), 1) if total > 0 else 0,
-            'neutral_percentage': round((neutral / total * 100), 1) if total > 0 else 0,
+            'positive_percentage': round(positive * scale, 1) if total > 0 else 0,
+            'negative_percentage': round(negative * scale, 1) if total > 0 else 0,
+            'neutral_percentage': round(neutral * scale, 1) if total > 0 else 0,
             'review_limit': review_limit,
             'remaining_reviews': max(review_limit - total, 0),
             'can_collect_more': total < review_limit,
@@ -120,7 +192,7 @@ def project_analysis_status(request, project_id):
 
         apps_data[entry['key']] = app_payload
 
-    return Response({
+    return {
         'project_info': {
             'project_id': project.id,
             'project_name': project.name,
@@ -133,7 +205,9 @@ def project_analysis_status(request, project_id):
         'message': f"Found {len(task_data)} active tasks" if task_data else 'No active tasks',
         'review_limit': review_limit,
         'subscription_tier': profile.subscription_tier,
-    })
+    }
+
+
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
 def start_analysis(request):
@@ -149,31 +223,49 @@ def start_analysis(request):
             'error': 'app_id is required'
         }, status=status.HTTP_400_BAD_REQUEST)
 
-    # Verify user has access to this app
-    try:
-        project = Project.objects.get(id=project_id, user=request.user)
-
-        if app_id == project.home_app_id:
-            app_name = project.home_app_name
-        else:
-            competitor = CompetitorApp.objects.filter(project=project, app_id=app_id).first()
-            if not competitor:
-                return Response({
-                    'error': 'App not found in this project'
-                }, status=status.HTTP_404_NOT_FOUND)
-            app_name = competitor.app_name
-
-    except Project.DoesNotExist:
+    # Verify user has access to this app; the competitor name rides along
+    # with the project lookup so both checks cost one query
+    project = Project.objects.filter(id=project_id, user=request.user).annotate(
+        competitor_name=Subquery(
+            CompetitorApp.objects.filter(project=OuterRef('pk'), app_id=app_id)
+            .values('app_name')[:1]
+        )
+    ).only('id', 'home_app_id', 'home_app_name').first()
+    if project is None:
         return Response({
             'error': 'Project not found'
         }, status=status.HTTP_404_NOT_FOUND)
 
+    if app_id == project.home_app_id:
+        app_name = project.home_app_name
+    elif project.competitor_name is not None:
+        app_name = project.competitor_name
+    else:
+        return Response({
+            'error': 'App not found in this project'
+        }, status=status.HTTP_404_NOT_FOUND)
+
+    # Serialise submissions per user and app: the tracker check below cannot
+    # see a concurrent request whose tracker row is not written yet
+    lock_key = f"start_analysis_lock_{request.user.id}_{app_id}"
+    if not cache.add(lock_key, 1, START_ANALYSIS_LOCK_TIMEOUT):
+        return Response({
+            'error': f'Analysis already in progress for {app_name}',
+        }, status=status.HTTP_409_CONFLICT)
+
+    try:
+        return _start_tracked_analysis(request.user, project, app_id, app_name, analysis_type)
+    finally:
+        cache.delete(lock_key)
+
+
+def _start_tracked_analysis(user, project, app_id, app_name, analysis_type):
     # Check if there's already an active task for this app
     existing_task = TaskTracker.objects.filter(
         app_id=app_id,
-        user=request.user,
-        status__in=['pending', 'started', 'progress']
-    ).first()
+        user=user,
+        status__in=ACTIVE_TASK_STATUSES
+    ).only('task_id', 'status', 'task_type').first()
 
     if existing_task:
         return Response({
@@ -184,13 +276,13 @@ def start_analysis(request):
         }, status=status.HTTP_409_CONFLICT)
 
     # Get user profile
-    profile = UserProfile.objects.get_or_create(user=request.user)[0]
+    profile = UserProfile.for_user(user)
 
     # Start the analysis
     try:
         task_result = import_google_play_reviews_for_user(
             app_id=app_id,
-            user_id=request.user.id,
+            user_id=user.id,
             subscription_tier=profile.subscription_tier,
             quick_analysis=(analysis_type == 'quick'),
             app_name=app_name,
@@ -219,6 +311,8 @@ def task_status_detail(request, task_id):
     """
     try:
         task = TaskTracker.objects.get(task_id=task_id, user=request.user)
+        if task.is_active():
+            task.apply_cached_progress()
         return Response({
             'task_id': task.task_id,
             'app_id': task.app_id,
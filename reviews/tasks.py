@@ -1,8 +1,11 @@
 import logging
 import requests
+from concurrent.futures import ThreadPoolExecutor
 import xml.etree.ElementTree as ET
 from django.conf import settings
 from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models import Q
 from datetime import datetime
 from django.utils import timezone
 from django.utils.dateparse import parse_datetime
@@ -11,6 +14,8 @@ from celery import shared_task
 from googleapiclient.discovery import build
 from google_play_scraper import reviews, Sort
 from .models import Review, TaskTracker, Project, UserProfile
+from .cache_utils import mark_reviews_updated
+from .dashboard_services import build_sentiment_trend, calculate_strategic_scores
 logger = logging.getLogger(__name__)
 
 # --- Configuration ---
@@ -70,181 +75,234 @@ def collect_reviews_task(self, app_id, max_reviews, user_id=None, subscription_t
 
     total_new_reviews = 0
     total_skipped_reviews = 0
+    stored_any = False
     total_processed = 0
     continuation_token = None
     page_count = 0
 
-    while total_processed < max_reviews:
-        page_count += 1
-        remaining_needed = max_reviews - total_processed
-        count_for_request = min(REVIEW_COUNT, remaining_needed)
+    def fetch_page(count, token):
+        return reviews(
+            app_id,
+            lang='en',
+            country=APP_COUNTRY,
+            sort=Sort.NEWEST,
+            count=count,
+            continuation_token=token
+        )
 
-        logger.info(f"Fetching page {page_count}, requesting {count_for_request} reviews...")
+    # Fetch the next page in the background while the current one is scored
+    prefetcher = ThreadPoolExecutor(max_workers=1)
+    next_page = None
 
-        try:
-            result, continuation_token = reviews(
-                app_id,
-                lang='en',
-                country=APP_COUNTRY,
-                sort=Sort.NEWEST,
-                count=count_for_request,
-                continuation_token=continuation_token
-            )
-        except Exception as e:
-            logger.error(f"Failed to fetch reviews from Google Play Store on page {page_count}: {e}")
-            break
+    try:
+        while total_processed < max_reviews:
+            page_count += 1
+            remaining_needed = max_reviews - total_processed
+            count_for_request = min(REVIEW_COUNT, remaining_needed)
 
-        if not result:
-            logger.info(f"No more reviews available after page {page_count}")
-            break
+            logger.info(f"Fetching page {page_count}, requesting {count_for_request} reviews...")
 
-        # Process reviews from this page
-        page_new_count = 0
-        page_skipped_count = 0
+            try:
+                if next_page is not None:
+                    result, continuation_token = next_page.result()
+                else:
+                    result, continuation_token = fetch_page(count_for_request, continuation_token)
+            except Exception as e:
+                logger.error(f"Failed to fetch reviews from Google Play Store on page {page_count}: {e}")
+                break
 
-        for review_data in result:
-            if total_processed >= max_reviews:
+            if not result:
+                logger.info(f"No more reviews available after page {page_count}")
                 break
 
-            # Calculate sentiment score
-            content = review_data.get('content', '') or ''
-            if content.strip():
-                sentiment_result = sentiment_pipeline(content)
-                label = sentiment_result[0]['label']
-                if label in ['4 stars', '5 stars']:
-                    sentiment_score = sentiment_result[0]['score']
-                elif label in ['1 star', '2 stars']:
-                    sentiment_score = -sentiment_result[0]['score']
+            # Every review on the page counts as processed, so the next request size is known now
+            next_count = min(REVIEW_COUNT, remaining_needed - len(result))
+            next_page = None
+            if continuation_token and next_count > 0:
+                next_page = prefetcher.submit(fetch_page, next_count, continuation_token)
+
+            # Score and normalise this page before writing it in bulk
+            page_rows = {}
+
+            for review_data in result:
+                if total_processed >= max_reviews:
+                    break
+
+                # Calculate sentiment score
+                content = review_data.get('content', '') or ''
+                if content.strip():
+                    sentiment_result = sentiment_pipeline(content)
+                    label = sentiment_result[0]['label']
+                    if label in ['4 stars', '5 stars']:
+                        sentiment_score = sentiment_result[0]['score']
+                    elif label in ['1 star', '2 stars']:
+                        sentiment_score = -sentiment_result[0]['score']
+                    else:
+                        sentiment_score = 0.0
                 else:
-                    sentiment_score = 0.0
-            else:
-                rating = review_data.get('score', 3)
-                if rating >= 4:
-                    sentiment_score = 0.5
-                elif rating <= 2:
-                    sentiment_score = -0.5
+                    rating = review_data.get('score', 3)
+                    if rating >= 4:
+                        sentiment_score = 0.5
+                    elif rating <= 2:
+                        sentiment_score = -0.5
+                    else:
+                        sentiment_score = 0.0
+
+                raw_timestamp = review_data.get('at')
+                if page_count == 1 and len(page_rows) < 5:
+                    print(
+                        f"[collect_reviews_task] Raw 'at' for {review_data.get('reviewId')}: {raw_timestamp!r} "
+                        f"(type={type(raw_timestamp).__name__})"
+                    )
+
+                review_created_at = raw_timestamp or timezone.now()
+                if isinstance(review_created_at, str):
+                    parsed = parse_datetime(review_created_at)
+                    if parsed is None:
+                        try:
+                            parsed = datetime.fromisoformat(review_created_at)
+                        except ValueError:
+                            parsed = None
+                    review_created_at = parsed or timezone.now()
+                elif isinstance(review_created_at, datetime):
+                    pass
                 else:
-                    sentiment_score = 0.0
-
-            raw_timestamp = review_data.get('at')
-            if page_count == 1 and page_new_count < 5:
-                print(
-                    f"[collect_reviews_task] Raw 'at' for {review_data.get('reviewId')}: {raw_timestamp!r} "
-                    f"(type={type(raw_timestamp).__name__})"
-                )
-
-            review_created_at = raw_timestamp or timezone.now()
-            if isinstance(review_created_at, str):
-                parsed = parse_datetime(review_created_at)
-                if parsed is None:
-                    try:
-                        parsed = datetime.fromisoformat(review_created_at)
-                    except ValueError:
-                        parsed = None
-                review_created_at = parsed or timezone.now()
-            elif isinstance(review_created_at, datetime):
-                pass
-            else:
-                print(
-                    f"[collect_reviews_task] Unexpected 'at' type for {review_data.get('reviewId')}: "
-                    f"{type(review_created_at).__name__}"
-                )
-                review_created_at = timezone.now()
-            if timezone.is_naive(review_created_at):
-                review_created_at = timezone.make_aware(review_created_at)
-
-            # Save review
-            review_obj, created = Review.objects.get_or_create(
-                review_id=review_data['reviewId'],
-                defaults={
-                    'author': review_data.get('userName', ''),
-                    'rating': review_data.get('score', 3),
-                    'content': content,
-                    'created_at': review_created_at,
-                    'source': 'Google Play',
-                    'title': '',
-                    'sentiment_score': sentiment_score,
+                    print(
+                        f"[collect_reviews_task] Unexpected 'at' type for {review_data.get('reviewId')}: "
+                        f"{type(review_created_at).__name__}"
+                    )
+                    review_created_at = timezone.now()
+                if timezone.is_naive(review_created_at):
+                    review_created_at = timezone.make_aware(review_created_at)
+
+                page_rows.setdefault(review_data['reviewId'], (review_data, content, sentiment_score, review_created_at))
+
+            # One SELECT for the page's existing reviews, then batched INSERT/UPDATE
+            existing_reviews = Review.objects.filter(review_id__in=list(page_rows)).only(
+                'id', 'review_id', 'created_at', 'sentiment_score'
+            ).in_bulk(field_name='review_id')
+            new_reviews = []
+            changed_reviews = []
+            for review_id, (review_data, content, sentiment_score, review_created_at) in page_rows.items():
+                review_obj = existing_reviews.get(review_id)
+                if review_obj is None:
+                    new_reviews.append(Review(
+                        review_id=review_id,
+                        author=review_data.get('userName', ''),
+                        rating=review_data.get('score', 3),
+                        content=content,
+                        created_at=review_created_at,
+                        source='Google Play',
+                        title='',
+                        sentiment_score=sentiment_score,
+                        app_id=app_id,
+                    ))
+                elif review_obj.created_at != review_created_at or review_obj.sentiment_score != sentiment_score:
+                    review_obj.created_at = review_created_at
+                    review_obj.sentiment_score = sentiment_score
+                    changed_reviews.append(review_obj)
+
+            with transaction.atomic():
+                Review.objects.bulk_create(new_reviews, batch_size=1000, ignore_conflicts=True)
+                if changed_reviews:
+                    Review.objects.bulk_update(changed_reviews, ['created_at', 'sentiment_score'], batch_size=1000)
+            if new_reviews or changed_reviews:
+                stored_any = True
+
+            page_new_count = len(new_reviews)
+            page_skipped_count = len(result) - page_new_count
+            total_new_reviews += page_new_count
+            total_skipped_reviews += page_skipped_count
+
+            total_processed = total_new_reviews + total_skipped_reviews
+            logger.info(f"Page {page_count} complete: {page_new_count} new, {page_skipped_count} duplicates")
+
+            # Update progress - both Celery state AND database tracker
+            progress_percent = min(100, int((total_processed / max_reviews) * 100))
+
+            # Update TaskTracker in database for persistent tracking
+            tracker.update_progress(total_processed, max_reviews, 'progress')
+
+            # Also update Celery state for immediate feedback
+            self.update_state(
+                state='PROGRESS',
+                meta={
+                    'current_reviews': total_processed,
+                    'total_reviews': max_reviews,
+                    'new_reviews': total_new_reviews,
+                    'skipped_reviews': total_skipped_reviews,
+                    'progress_percent': progress_percent,
+                    'page_count': page_count,
                     'app_id': app_id,
+                    'app_name': tracker.app_name,
+                    'task_type': tracker.task_type,
+                    'status': f'Collecting reviews... {total_processed}/{max_reviews}'
                 }
             )
 
-            if created:
-                page_new_count += 1
-                total_new_reviews += 1
-            else:
-                update_fields = []
-                if review_obj.created_at != review_created_at:
-                    review_obj.created_at = review_created_at
-                    update_fields.append('created_at')
-                if review_obj.sentiment_score != sentiment_score:
-                    review_obj.sentiment_score = sentiment_score
-                    update_fields.append('sentiment_score')
-                if update_fields:
-                    review_obj.save(update_fields=update_fields)
-                page_skipped_count += 1
-                total_skipped_reviews += 1
-
-        total_processed = total_new_reviews + total_skipped_reviews
-        logger.info(f"Page {page_count} complete: {page_new_count} new, {page_skipped_count} duplicates")
-
-        # Update progress - both Celery state AND database tracker
-        progress_percent = min(100, int((total_processed / max_reviews) * 100))
-
-        # Update TaskTracker in database for persistent tracking
-        tracker.update_progress(total_processed, max_reviews, 'progress')
-
-        # Also update Celery state for immediate feedback
-        self.update_state(
-            state='PROGRESS',
-            meta={
-                'current_reviews': total_processed,
-                'total_reviews': max_reviews,
-                'new_reviews': total_new_reviews,
-                'skipped_reviews': total_skipped_reviews,
-                'progress_percent': progress_percent,
-                'page_count': page_count,
-                'app_id': app_id,
-                'app_name': tracker.app_name,
-                'task_type': tracker.task_type,
-                'status': f'Collecting reviews... {total_processed}/{max_reviews}'
-            }
-        )
-
-        # Stopping conditions
-        if total_processed >= max_reviews:
-            logger.info(f"Reached target of {max_reviews} reviews")
-            break
-        if not continuation_token:
-            logger.info("No more pages available")
-            break
-        # More lenient duplicate stopping - only stop if we get NO new reviews on a page
-        # and we've collected at least the minimum target, to prevent early termination
-        minimum_before_duplicate_stop = int(max_reviews * 0.80) if max_reviews <= 300 else max_reviews - 100
-        if page_count > 3 and page_new_count == 0 and total_new_reviews >= minimum_before_duplicate_stop:
-            logger.info(f"No new reviews on page {page_count} and collected {total_new_reviews} (minimum: {minimum_before_duplicate_stop}), stopping")
-            break
-        # Only stop for insufficient results if we haven't reached our minimum target
-        # For quick analysis (200 reviews), don't stop early unless we have at least 150
-        minimum_for_early_stop = int(max_reviews * 0.75) if max_reviews <= 300 else max_reviews - 100
-        if len(result) < count_for_request:
-            if total_new_reviews < minimum_for_early_stop:
-                logger.info(f"Got {len(result)} but requested {count_for_request}, continuing to reach minimum {minimum_for_early_stop} (currently: {total_new_reviews})")
-                # Continue instead of breaking - we need more reviews
-            else:
-                logger.info(f"Got {len(result)} but requested {count_for_request}, acceptable since we have {total_new_reviews} reviews (minimum: {minimum_for_early_stop})")
+            # Stopping conditions
+            if total_processed >= max_reviews:
+                logger.info(f"Reached target of {max_reviews} reviews")
                 break
+            if not continuation_token:
+                logger.info("No more pages available")
+                break
+            # More lenient duplicate stopping - only stop if we get NO new reviews on a page
+            # and we've collected at least the minimum target, to prevent early termination
+            minimum_before_duplicate_stop = int(max_reviews * 0.80) if max_reviews <= 300 else max_reviews - 100
+            if page_count > 3 and page_new_count == 0 and total_new_reviews >= minimum_before_duplicate_stop:
+                logger.info(f"No new reviews on page {page_count} and collected {total_new_reviews} (minimum: {minimum_before_duplicate_stop}), stopping")
+                break
+            # Only stop for insufficient results if we haven't reached our minimum target
+            # For quick analysis (200 reviews), don't stop early unless we have at least 150
+            minimum_for_early_stop = int(max_reviews * 0.75) if max_reviews <= 300 else max_reviews - 100
+            if len(result) < count_for_request:
+                if total_new_reviews < minimum_for_early_stop:
+                    logger.info(f"Got {len(result)} but requested {count_for_request}, continuing to reach minimum {minimum_for_early_stop} (currently: {total_new_reviews})")
+                    # Continue instead of breaking - we need more reviews
+                else:
+                    logger.info(f"Got {len(result)} but requested {count_for_request}, acceptable since we have {total_new_reviews} reviews (minimum: {minimum_for_early_stop})")
+                    break
+    finally:
+        # Also on errors, so a failed page never leaks the pool or its pending fetch
+        prefetcher.shutdown(wait=False, cancel_futures=True)
 
     summary = f"Collection complete for {app_id}: {total_new_reviews} new, {total_skipped_reviews} duplicates"
     logger.info(summary)
 
     # Mark task as completed in database
-    tracker.update_progress(total_processed, max_reviews, 'success')
     tracker.result_message = summary
-    tracker.save()
+    tracker.update_progress(total_processed, max_reviews, 'success')
+
+    # Invalidate once per import rather than once per page
+    if stored_any:
+        mark_reviews_updated([app_id])
+    if total_new_reviews:
+        warm_dashboard_cache.delay(app_id)
 
     return summary
 
 
+@shared_task(ignore_result=True)
+def warm_dashboard_cache(app_id):
+    """
+    Recompute the cached dashboard payloads for every project tracking app_id,
+    so the first dashboard load after an import is served from cache.
+    """
+    projects = Project.objects.filter(
+        Q(home_app_id=app_id) |
+        Q(apple_app_id=app_id) |
+        Q(competitors__app_id=app_id) |
+        Q(competitors__apple_app_id=app_id)
+    ).distinct()
+
+    for project in projects:
+        calculate_strategic_scores(project)
+        if project.home_app_id:
+            # Default view of the trend chart: home app, no comparison, 30 days
+            build_sentiment_trend(project, project.home_app_id)
+
+
 def import_google_play_reviews_for_user(app_id, user_id=None, subscription_tier='free', quick_analysis=True, app_name=None, project_id=None):
     """
     Progressive disclosure wrapper with proper TaskTracker integration.
@@ -301,6 +359,12 @@ def import_google_play_reviews_full_analysis(app_id, user_id=None, subscription_
 
 APPLE_APP_COUNTRY = 'us'
 
+# Columns refreshed on reviews the feed returns again
+APPLE_REVIEW_UPDATE_FIELDS = [
+    'author', 'title', 'content', 'rating', 'sentiment_score',
+    'app_id', 'created_at', 'counts_toward_score',
+]
+
 APPLE_SUBSCRIPTION_REVIEW_LIMITS = {
     'free': 200,
     'starter': 500,
@@ -661,8 +725,7 @@ def import_apple_app_store_reviews(app_id, user_id=None, subscription_tier='free
         max_length=512,
     )
 
-    new_reviews_count = 0
-    skipped_reviews_count = 0
+    entry_rows = {}
     total_processed = 0
     debug_sample_limit = 3
     debug_sample_index = 0
@@ -755,47 +818,39 @@ def import_apple_app_store_reviews(app_id, user_id=None, subscription_tier='free
             'created_at': review_created_at,
             'counts_toward_score': True,
         }
+        entry_rows.setdefault(review_id, defaults)
 
-        review_obj, created = Review.objects.get_or_create(
-            review_id=review_id,
-            defaults=defaults,
-        )
+        total_processed += 1
 
-        if created:
-            new_reviews_count += 1
-        else:
-            update_fields = []
-            if review_obj.author != author:
-                review_obj.author = author
-                update_fields.append('author')
-            if review_obj.title != title:
-                review_obj.title = title
-                update_fields.append('title')
-            if review_obj.content != content:
-                review_obj.content = content
-                update_fields.append('content')
-            if review_obj.rating != rating:
-                review_obj.rating = rating
-                update_fields.append('rating')
-            if review_obj.sentiment_score != sentiment_score:
-                review_obj.sentiment_score = sentiment_score
-                update_fields.append('sentiment_score')
-            if review_obj.app_id != app_id:
-                review_obj.app_id = app_id
-                update_fields.append('app_id')
-            if review_obj.created_at != review_created_at:
-                review_obj.created_at = review_created_at
-                update_fields.append('created_at')
-            if not review_obj.counts_toward_score:
-                review_obj.counts_toward_score = True
-                update_fields.append('counts_toward_score')
-
-            if update_fields:
-                review_obj.save(update_fields=update_fields)
-
-            skipped_reviews_count += 1
+    # One SELECT for the feed's existing reviews, then batched INSERT/UPDATE
+    existing_reviews = Review.objects.filter(review_id__in=list(entry_rows)).only(
+        'id', 'review_id', *APPLE_REVIEW_UPDATE_FIELDS
+    ).in_bulk(field_name='review_id')
+    new_reviews = []
+    changed_reviews = []
+    for review_id, defaults in entry_rows.items():
+        review_obj = existing_reviews.get(review_id)
+        if review_obj is None:
+            new_reviews.append(Review(review_id=review_id, **defaults))
+            continue
 
-        total_processed += 1
+        changed = False
+        for field in APPLE_REVIEW_UPDATE_FIELDS:
+            if getattr(review_obj, field) != defaults[field]:
+                setattr(review_obj, field, defaults[field])
+                changed = True
+        if changed:
+            changed_reviews.append(review_obj)
+
+    with transaction.atomic():
+        Review.objects.bulk_create(new_reviews, batch_size=1000, ignore_conflicts=True)
+        if changed_reviews:
+            Review.objects.bulk_update(changed_reviews, APPLE_REVIEW_UPDATE_FIELDS, batch_size=1000)
+    if new_reviews or changed_reviews:
+        mark_reviews_updated([app_id])
+
+    new_reviews_count = len(new_reviews)
+    skipped_reviews_count = total_processed - new_reviews_count
 
     summary = (
         "Apple import complete. "
@@ -803,6 +858,10 @@ def import_apple_app_store_reviews(app_id, user_id=None, subscription_tier='free
         f"New reviews added: {new_reviews_count}. Duplicates skipped: {skipped_reviews_count}."
     )
     logger.info(summary)
+
+    if new_reviews_count:
+        warm_dashboard_cache.delay(app_id)
+
     return summary
 
 def extract_pain_points(app_id=None):
@@ -820,14 +879,11 @@ def extract_pain_points(app_id=None):
     if app_id:
         negative_reviews = negative_reviews.filter(app_id=app_id)
 
-    if negative_reviews.count() < 10:
-        logger.warning(f"Not enough negative reviews ({negative_reviews.count()}) for topic modeling")
-        return []
-
-    # Extract review text
-    review_texts = [review.content for review in negative_reviews if review.content]
+    # Extract review text in the same query that tells us whether there is enough data
+    review_texts = [content for content in negative_reviews.values_list('content', flat=True) if content]
 
     if len(review_texts) < 10:
+        logger.warning(f"Not enough negative reviews ({len(review_texts)}) for topic modeling")
         return []
 
     # Vectorize the text (convert to numbers for LDA)
@@ -899,17 +955,18 @@ def run_weekly_updates():
     """
     logger.info("--- Starting Weekly Scheduled Updates ---")
 
-    all_projects = Project.objects.all()
+    # Load each owner and their profile with the project instead of per iteration
+    all_projects = Project.objects.select_related('user', 'user__userprofile')
 
     apps_to_update_count = 0
     for project in all_projects:
-        profile = UserProfile.objects.get_or_create(user=project.user)[0]
+        profile = UserProfile.for_user(project.user)
 
         if project.home_app_id:
             logger.info(f"Triggering Google Play update for project: {project.name}")
             import_google_play_reviews_for_user(
                 app_id=project.home_app_id,
-                user_id=project.user.id,
+                user_id=project.user_id,
                 subscription_tier=profile.subscription_tier,
                 quick_analysis=False,
                 app_name=project.home_app_name,
@@ -921,7 +978,7 @@ def run_weekly_updates():
             logger.info(f"Triggering Apple App Store update for project: {project.name}")
             import_apple_app_store_reviews.delay(
                 app_id=project.apple_app_id,
-                user_id=project.user.id,
+                user_id=project.user_id,
                 subscription_tier=profile.subscription_tier,
                 app_name=project.home_app_name,
                 project_id=project.id
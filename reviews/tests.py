@@ -1,3 +1,445 @@
-from django.test import TestCase
+from datetime import datetime, timedelta, timezone as dt_timezone
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from .dashboard_services import _compute_sentiment_trend, _sentiment_series
+from .models import TASK_PROGRESS_DB_INTERVAL, CompetitorApp, Project, Review, TaskTracker
+from .tasks import collect_reviews_task, import_apple_app_store_reviews
+from . import task_views
+
+# The shared Redis cache is not needed to exercise these code paths
+LOCMEM_CACHES = {
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+}
+
+
+def _five_star_pipeline(*args, **kwargs):
+    return lambda content: [{'label': '5 stars', 'score': 0.9}]
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class GooglePlayIngestTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user('owner')
+        self.posted_at = datetime(2025, 1, 15, 12, 0, tzinfo=dt_timezone.utc)
+        Review.objects.create(
+            review_id='gp-1',
+            app_id='com.example',
+            source='Google Play',
+            rating=5,
+            title='',
+            content='Great',
+            sentiment_score=0.0,
+            created_at=self.posted_at,
+        )
+
+    def _page_review(self, review_id, content='Great app'):
+        return {
+            'reviewId': review_id,
+            'userName': 'someone',
+            'score': 5,
+            'content': content,
+            'at': self.posted_at,
+        }
+
+    def _collect(self, page):
+        with mock.patch('reviews.tasks.reviews', return_value=(page, None)), \
+                mock.patch('reviews.tasks.pipeline', side_effect=_five_star_pipeline), \
+                mock.patch('reviews.tasks.warm_dashboard_cache') as warm, \
+                mock.patch.object(collect_reviews_task, 'update_state'):
+            result = collect_reviews_task.apply(
+                args=('com.example', 10, self.user.id), task_id='gp-task'
+            ).get()
+        return result, warm
+
+    def test_page_inserts_new_updates_existing_and_counts_duplicates(self):
+        page = [
+            self._page_review('gp-1'),
+            self._page_review('gp-2'),
+            self._page_review('gp-2'),
+            self._page_review('gp-3'),
+        ]
+
+        summary, warm = self._collect(page)
+
+        self.assertEqual(summary, 'Collection complete for com.example: 2 new, 2 duplicates')
+        self.assertEqual(
+            sorted(Review.objects.values_list('review_id', flat=True)),
+            ['gp-1', 'gp-2', 'gp-3'],
+        )
+        # The existing review is refreshed in place rather than duplicated
+        self.assertEqual(Review.objects.get(review_id='gp-1').sentiment_score, 0.9)
+        warm.delay.assert_called_once_with('com.example')
+
+        tracker = TaskTracker.objects.get(task_id='gp-task')
+        self.assertEqual(tracker.status, 'success')
+        self.assertEqual(tracker.current_reviews, 4)
+        self.assertEqual(tracker.result_message, summary)
+
+    def test_cache_invalidated_once_per_import(self):
+        pages = [
+            ([self._page_review('gp-2')], 'next-page'),
+            ([self._page_review('gp-3')], None),
+        ]
+        with mock.patch('reviews.tasks.reviews', side_effect=pages), \
+                mock.patch('reviews.tasks.pipeline', side_effect=_five_star_pipeline), \
+                mock.patch('reviews.tasks.warm_dashboard_cache'), \
+                mock.patch('reviews.tasks.mark_reviews_updated') as mark_updated, \
+                mock.patch.object(collect_reviews_task, 'update_state'):
+            collect_reviews_task.apply(args=('com.example', 10, self.user.id)).get()
+
+        self.assertEqual(Review.objects.count(), 3)
+        mark_updated.assert_called_once_with(['com.example'])
+
+    def test_page_of_known_reviews_adds_nothing(self):
+        summary, warm = self._collect([self._page_review('gp-1')])
+
+        self.assertEqual(summary, 'Collection complete for com.example: 0 new, 1 duplicates')
+        self.assertEqual(Review.objects.count(), 1)
+        warm.delay.assert_not_called()
+
+
+APPLE_FEED_TEMPLATE = """<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom" xmlns:im="http://itunes.apple.com/rss">
+  <entry><id>app-meta</id><title>Example</title></entry>
+  {entries}
+</feed>"""
+
+APPLE_ENTRY_TEMPLATE = """<entry>
+    <id>{review_id}</id>
+    <author><name>reviewer</name></author>
+    <title>{title}</title>
+    <content type="text">Works well</content>
+    <im:rating>5</im:rating>
+  </entry>"""
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class AppleIngestTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        Review.objects.create(
+            review_id='apple-1',
+            app_id='123',
+            source='Apple App Store',
+            rating=5,
+            title='Old title',
+            content='Works well',
+            sentiment_score=0.9,
+        )
+
+    def _import(self, entries):
+        feed = APPLE_FEED_TEMPLATE.format(entries=''.join(
+            APPLE_ENTRY_TEMPLATE.format(review_id=review_id, title=title)
+            for review_id, title in entries
+        )).encode()
+        response = mock.Mock(content=feed, text=feed.decode())
+        with mock.patch('reviews.tasks.requests.get', return_value=response), \
+                mock.patch('reviews.tasks.pipeline', side_effect=_five_star_pipeline), \
+                mock.patch('reviews.tasks.warm_dashboard_cache') as warm:
+            summary = import_apple_app_store_reviews('123')
+        return summary, warm
+
+    def test_feed_inserts_new_updates_existing_and_counts_duplicates(self):
+        summary, warm = self._import([
+            ('apple-1', 'New title'),
+            ('apple-2', 'Second'),
+            ('apple-2', 'Second'),
+            ('apple-3', 'Third'),
+        ])
+
+        self.assertIn('Processed 4 reviews', summary)
+        self.assertIn('New reviews added: 2. Duplicates skipped: 2.', summary)
+        self.assertEqual(
+            sorted(Review.objects.values_list('review_id', flat=True)),
+            ['apple-1', 'apple-2', 'apple-3'],
+        )
+        self.assertEqual(Review.objects.get(review_id='apple-1').title, 'New title')
+        warm.delay.assert_called_once_with('123')
+
+    def test_feed_of_known_reviews_adds_nothing(self):
+        summary, warm = self._import([('apple-1', 'Old title')])
+
+        self.assertIn('New reviews added: 0. Duplicates skipped: 1.', summary)
+        self.assertEqual(Review.objects.count(), 1)
+        warm.delay.assert_not_called()
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class TaskStatusTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(User.objects.create_user('owner'))
+
+    def test_ready_result_is_served_from_cache(self):
+        result = mock.Mock(status='SUCCESS', result='done')
+        result.ready.return_value = True
+        result.successful.return_value = True
+        url = reverse('task-status', args=['celery-1'])
+
+        with mock.patch('reviews.project_views.AsyncResult', return_value=result) as async_result:
+            first = self.client.get(url)
+            second = self.client.get(url)
+
+        self.assertEqual(async_result.call_count, 1)
+        self.assertEqual(first.json(), second.json())
+        self.assertEqual(second.json()['result'], 'done')
+
+    def test_cached_result_is_not_shared_between_users(self):
+        owner = User.objects.get(username='owner')
+        TaskTracker.objects.create(
+            task_id='celery-3', user=owner, app_id='com.example', app_name='Example',
+            task_type='quick', status='success', result_message='owner only',
+        )
+        url = reverse('task-status', args=['celery-3'])
+        self.assertEqual(self.client.get(url).json()['result'], 'owner only')
+
+        pending = mock.Mock(status='PENDING', info=None)
+        pending.ready.return_value = False
+        other = APIClient()
+        other.force_authenticate(User.objects.create_user('other'))
+        with mock.patch('reviews.project_views.AsyncResult', return_value=pending) as async_result:
+            response = other.get(url)
+
+        async_result.assert_called_once_with('celery-3')
+        self.assertEqual(response.json()['status'], 'PENDING')
+        self.assertNotIn('result', response.json())
+
+    def test_running_task_is_not_cached(self):
+        result = mock.Mock(status='PROGRESS', info={'current_reviews': 10})
+        result.ready.return_value = False
+        url = reverse('task-status', args=['celery-2'])
+
+        with mock.patch('reviews.project_views.AsyncResult', return_value=result) as async_result:
+            self.client.get(url)
+            response = self.client.get(url)
+
+        self.assertEqual(async_result.call_count, 2)
+        self.assertEqual(response.json()['info'], {'current_reviews': 10})
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class StartAnalysisLockTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user('owner')
+        self.project = Project.objects.create(
+            user=self.user, name='Project', home_app_id='com.example', home_app_name='Example'
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.lock_key = f"start_analysis_lock_{self.user.id}_com.example"
+
+    def _start(self):
+        with mock.patch(
+            'reviews.task_views.import_google_play_reviews_for_user',
+            return_value=mock.Mock(id='celery-1'),
+        ) as submit:
+            response = self.client.post(
+                reverse('start-analysis'),
+                {'app_id': 'com.example', 'project_id': self.project.id},
+                format='json',
+            )
+        return response, submit
+
+    def test_start_releases_its_lock(self):
+        response, submit = self._start()
+
+        self.assertEqual(response.status_code, 201)
+        submit.assert_called_once()
+        self.assertIsNone(cache.get(self.lock_key))
+
+    def test_start_is_refused_while_locked_and_accepted_after_expiry(self):
+        # Another submission for the same user and app is still in flight
+        cache.add(self.lock_key, 1, task_views.START_ANALYSIS_LOCK_TIMEOUT)
+
+        response, submit = self._start()
+        self.assertEqual(response.status_code, 409)
+        submit.assert_not_called()
+
+        # The lock expires
+        cache.delete(self.lock_key)
+
+        response, submit = self._start()
+        self.assertEqual(response.status_code, 201)
+        submit.assert_called_once()
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class SentimentTrendTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.now = timezone.now()
+        user = User.objects.create_user('owner')
+        self.project = Project.objects.create(
+            user=user, name='Project', home_app_id='com.home', home_app_name='Home'
+        )
+        CompetitorApp.objects.create(project=self.project, app_id='com.rival', app_name='Rival')
+
+        # Home has reviews inside the 30 day window, the competitor only older ones
+        self._review('com.home', days_ago=10, score=0.8)
+        self._review('com.home', days_ago=3, score=0.8)
+        self._review('com.home', days_ago=3, score=-0.8)
+        self._review('com.rival', days_ago=100, score=0.8)
+        self._review('com.rival', days_ago=60, score=-0.8)
+
+    def _review(self, app_id, days_ago, score):
+        Review.objects.create(
+            review_id=f"{app_id}-{days_ago}-{score}",
+            app_id=app_id,
+            source='Google Play',
+            rating=3,
+            title='',
+            content='',
+            sentiment_score=score,
+            created_at=self.now - timedelta(days=days_ago),
+        )
+
+    def test_empty_group_falls_back_to_its_oldest_review(self):
+        series = _sentiment_series(
+            {'home': ['com.home'], 'competitor': ['com.rival']},
+            self.now - timedelta(days=30),
+            self.now,
+        )
+
+        home_days = [point['bucket'].date() for point in series['home']]
+        self.assertEqual(home_days, [
+            (self.now - timedelta(days=10)).date(),
+            (self.now - timedelta(days=3)).date(),
+        ])
+        self.assertEqual(series['home'][1]['positive'], 50.0)
+
+        # The fallback spans more than 30 days, so it is bucketed weekly from
+        # the week of the competitor's oldest review
+        earliest = self.now - timedelta(days=100)
+        week_starts = [point['bucket'].date() for point in series['competitor']]
+        self.assertEqual(week_starts[0], earliest.date() - timedelta(days=earliest.weekday()))
+        self.assertEqual(len(week_starts), 2)
+        self.assertEqual(week_starts, sorted(week_starts))
+
+    def test_trend_merges_buckets_in_date_order(self):
+        trend = _compute_sentiment_trend(self.project, 'com.home', 'com.rival', '30d')
+
+        # Competitor fallback weeks come first, then the home days in the window
+        self.assertEqual([point['competitor'] for point in trend], [100.0, 0.0, None, None])
+        self.assertEqual([point['positive'] for point in trend], [0.0, 0.0, 100.0, 50.0])
+        self.assertEqual(trend[2]['date'], (self.now - timedelta(days=10)).strftime('%b %d'))
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class AddCompetitorTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user('owner')
+        self.project = Project.objects.create(
+            user=self.user, name='Project', home_app_id='com.home', home_app_name='Home'
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_concurrent_add_is_reported_as_existing_competitor(self):
+        # A concurrent request inserted the row after this one's existence check
+        CompetitorApp.objects.create(project=self.project, app_id='com.rival', app_name='Rival')
+        passed_check = mock.Mock(exists=mock.Mock(return_value=False))
+
+        with mock.patch.object(CompetitorApp.objects, 'filter', return_value=passed_check), \
+                mock.patch('reviews.project_views.import_google_play_reviews_for_user') as submit:
+            response = self.client.post(
+                reverse('add-competitor'),
+                {'project_id': self.project.id, 'app_id': 'com.rival', 'app_name': 'Rival'},
+                format='json',
+            )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {'error': 'This app is already a competitor in this project'})
+        submit.assert_not_called()
+        self.assertEqual(CompetitorApp.objects.filter(project=self.project).count(), 1)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class TaskProgressTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user('owner')
+        self.project = Project.objects.create(
+            user=self.user, name='Project', home_app_id='com.example', home_app_name='Example'
+        )
+        self.tracker = TaskTracker.objects.create(
+            task_id='celery-1', task_type='quick', app_id='com.example', app_name='Example',
+            user=self.user, project=self.project, status='started', target_reviews=200,
+        )
+        self.clock = 1000.0
+        patcher = mock.patch('reviews.models.time.monotonic', side_effect=lambda: self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _stored(self):
+        return TaskTracker.objects.get(task_id='celery-1')
+
+    def test_progress_tick_is_written_to_cache(self):
+        self.tracker.update_progress(50, 200)
+
+        expected = {'status': 'progress', 'current_reviews': 50, 'target_reviews': 200, 'progress_percent': 25.0}
+        self.assertEqual(cache.get(TaskTracker.progress_cache_key('celery-1')), expected)
+        self.assertEqual(TaskTracker.cached_progress(['celery-1', 'celery-2']), {'celery-1': expected})
+
+    def test_row_is_refreshed_only_after_the_interval(self):
+        self.tracker.update_progress(50, 200)
+        self.assertEqual(self._stored().current_reviews, 50)
+
+        self.clock += TASK_PROGRESS_DB_INTERVAL - 1
+        self.tracker.update_progress(100, 200)
+        stored = self._stored()
+        self.assertEqual(stored.current_reviews, 50)
+        stored.apply_cached_progress()
+        self.assertEqual(stored.current_reviews, 100)
+
+        self.clock += 1
+        self.tracker.update_progress(150, 200)
+        self.assertEqual(self._stored().current_reviews, 150)
+
+    def test_terminal_write_persists_messages_and_clears_cache(self):
+        self.tracker.update_progress(50, 200)
+        self.tracker.result_message = 'Collection complete'
+        self.tracker.update_progress(200, 200, 'success')
+
+        stored = self._stored()
+        self.assertEqual(stored.status, 'success')
+        self.assertEqual(stored.result_message, 'Collection complete')
+        self.assertIsNotNone(stored.completed_at)
+        self.assertIsNone(cache.get(TaskTracker.progress_cache_key('celery-1')))
+
+    def test_failure_persists_error_message(self):
+        self.tracker.error_message = 'Store unavailable'
+        self.tracker.update_progress(0, 200, 'failure')
+
+        stored = self._stored()
+        self.assertEqual(stored.status, 'failure')
+        self.assertEqual(stored.error_message, 'Store unavailable')
+
+    def test_status_payload_follows_cached_progress(self):
+        client = APIClient()
+        client.force_authenticate(self.user)
+        url = reverse('project-analysis-status', args=[self.project.id])
+
+        self.tracker.update_progress(50, 200)
+        first = client.get(url).json()
+        self.assertEqual(first['active_tasks'][0]['current_reviews'], 50)
+
+        # Within the interval only the cache moves, yet the payload follows it
+        self.clock += 1
+        self.tracker.update_progress(100, 200)
+        second = client.get(url).json()
+        self.assertEqual(self._stored().current_reviews, 50)
+        self.assertEqual(second['active_tasks'][0]['current_reviews'], 100)
+        self.assertEqual(
+            second['competitor_analysis']['com.example']['review_import']['progress_percent'], 50.0
+        )
@@ -554,8 +554,9 @@ def analyze_app_topics(app_id, sentiment_filter=None):
     # Get reviews for the app
     app_ids = expand_app_ids(app_id)
     reviews = Review.objects.filter(app_id__in=app_ids, counts_toward_score=True)
+    total_reviews = reviews.count()
 
-    if not reviews.exists():
+    if not total_reviews:
         return {
             'error': f'No reviews found for app {app_id}',
             'topics': [],
@@ -571,7 +572,7 @@ def analyze_app_topics(app_id, sentiment_filter=None):
     # Add app context
     results['app_id'] = app_id
     results['app_ids'] = app_ids
-    results['total_reviews'] = reviews.count()
+    results['total_reviews'] = total_reviews
 
     return results
 
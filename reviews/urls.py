@@ -24,6 +24,7 @@ from .project_views import (
 )
 from .task_views import project_analysis_status, start_analysis, task_status_detail
 from .dashboard_views import (
+    project_dashboard_bundle,
     project_strategic_scores,
     project_sentiment_trends,
     strengths_insights,
@@ -65,6 +66,7 @@ urlpatterns = [
     path('market-mentions/', market_mentions, name='market-mentions'),
     path('projects/<int:project_id>/strategic-scores/', project_strategic_scores, name='project-strategic-scores'),
     path('projects/<int:project_id>/sentiment-trends/', project_sentiment_trends, name='project-sentiment-trends'),
+    path('projects/<int:project_id>/dashboard/', project_dashboard_bundle, name='project-dashboard-bundle'),
     path('analysis/start/', start_analysis, name='start-analysis'),
     path('tasks/<str:task_id>/detail/', task_status_detail, name='task-status-detail'),
 ]
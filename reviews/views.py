@@ -9,11 +9,13 @@ from .models import Review, Project, CompetitorApp, UserProfile
 from .serializers import ReviewSerializer
 from .topic_modeling import analyze_app_topics
 from .app_id_utils import expand_app_ids, expand_many_app_ids, get_reviews_for_app_id
+from .cache_utils import mark_reviews_updated
 from .tasks import import_google_play_reviews_for_user
 from celery.result import AsyncResult
 from datetime import datetime, timezone
 import json
 import hashlib
+from itertools import chain
 
 
 class ReviewListView(generics.ListAPIView):
@@ -22,18 +24,25 @@ class ReviewListView(generics.ListAPIView):
 
     def get_queryset(self):
         user = self.request.user
-        projects = Project.objects.filter(user=user).prefetch_related('competitors')
-        app_ids = set()
-        for project in projects:
-            home_ids = expand_many_app_ids([project.home_app_id, project.apple_app_id])
-            app_ids.update(home_ids)
-            for competitor in project.competitors.all():
-                competitor_ids = expand_many_app_ids([competitor.app_id, competitor.apple_app_id])
-                app_ids.update(competitor_ids)
+        # Only the identifier columns are needed, so read them as plain tuples
+        project_ids = Project.objects.filter(user=user).values_list('home_app_id', 'apple_app_id')
+        competitor_ids = CompetitorApp.objects.filter(project__user=user).values_list('app_id', 'apple_app_id')
+        app_ids = expand_many_app_ids(chain.from_iterable(chain(project_ids, competitor_ids)))
         if not app_ids:
             return Review.objects.none()
         return Review.objects.filter(app_id__in=app_ids).order_by('-created_at')
 
+    def list(self, request, *args, **kwargs):
+        # ReviewSerializer is skipped on purpose: every declared field is a
+        # plain model column with no custom representation, so values() rows
+        # render identically without building model instances. Fields needing
+        # serializer logic must go back through get_serializer().
+        queryset = self.filter_queryset(self.get_queryset()).values(*ReviewSerializer.Meta.fields)
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(list(page))
+        return Response(list(queryset))
+
 
 @permission_classes([IsAuthenticated])
 @api_view(['GET'])
@@ -125,18 +134,23 @@ def market_mentions(request):
     if not app_id:
         return Response({'error': "The 'app_id' query parameter is required."}, status=status.HTTP_400_BAD_REQUEST)
 
-    review_qs = get_reviews_for_app_id(app_id).filter(counts_toward_score=False).order_by('-created_at')
+    review_rows = (
+        get_reviews_for_app_id(app_id)
+        .filter(counts_toward_score=False)
+        .order_by('-created_at')
+        .values_list('content', 'sentiment_score', 'source', 'created_at', 'title', 'review_id')
+    )
 
     mentions = [
         {
-            'content': review.content,
-            'sentiment_score': review.sentiment_score,
-            'source': review.source,
-            'created_at': review.created_at,
-            'title': review.title,
-            'url': review.review_id,
+            'content': content,
+            'sentiment_score': sentiment_score,
+            'source': source,
+            'created_at': created_at,
+            'title': title,
+            'url': review_id,
         }
-        for review in review_qs
+        for content, sentiment_score, source, created_at, title, review_id in review_rows
     ]
 
     return Response({
@@ -185,7 +199,7 @@ def competitor_analysis(request):
         return Response(cached_result)
 
     # If not cached, compute results
-    profile = UserProfile.objects.get_or_create(user=request.user)[0]
+    profile = UserProfile.for_user(request.user)
 
     # Get all app IDs for this project (home app + competitors)
     app_ids = [project.home_app_id]
@@ -195,24 +209,29 @@ def competitor_analysis(request):
     # Check for background tasks and trigger refreshes
     refresh_tasks = check_and_trigger_refreshes(project, request.user, profile, competitors, app_ids)
 
-    # Get reviews grouped by app using optimized database queries
-    apps_data = {}
-
-    for app_id in app_ids:
-        # Use database aggregation instead of Python loops for better performance
-        stats = Review.objects.filter(
-            app_id=app_id,
+    # Aggregate every app in one GROUP BY query instead of one query per app
+    stats_by_app = {
+        row['app_id']: row
+        for row in Review.objects.filter(
+            app_id__in=app_ids,
             sentiment_score__isnull=False
-        ).aggregate(
+        ).values('app_id').annotate(
             total=Count('id'),
             positive=Count('id', filter=Q(sentiment_score__gt=0.1)),
             negative=Count('id', filter=Q(sentiment_score__lt=-0.1)),
             avg_sentiment=Avg('sentiment_score')
         )
+    }
+    competitor_names = {comp.app_id: comp.app_name for comp in competitors}
 
-        total = stats['total'] or 0
-        positive = stats['positive'] or 0
-        negative = stats['negative'] or 0
+    apps_data = {}
+
+    for app_id in app_ids:
+        stats = stats_by_app.get(app_id, {})
+
+        total = stats.get('total') or 0
+        positive = stats.get('positive') or 0
+        negative = stats.get('negative') or 0
         neutral = total - positive - negative
 
         # Determine app name and type
@@ -220,8 +239,7 @@ def competitor_analysis(request):
             app_name = project.home_app_name
             app_type = "home"
         else:
-            competitor = competitors.filter(app_id=app_id).first()
-            app_name = competitor.app_name if competitor else app_id
+            app_name = competitor_names.get(app_id, app_id)
             app_type = "competitor"
 
         apps_data[app_id] = {
@@ -234,7 +252,7 @@ def competitor_analysis(request):
             'positive_percentage': round((positive / total * 100), 1) if total > 0 else 0,
             'negative_percentage': round((negative / total * 100), 1) if total > 0 else 0,
             'neutral_percentage': round((neutral / total * 100), 1) if total > 0 else 0,
-            'avg_sentiment': round(stats['avg_sentiment'] or 0, 3)
+            'avg_sentiment': round(stats.get('avg_sentiment') or 0, 3)
         }
 
     # Calculate market insights
@@ -290,21 +308,18 @@ def strategic_performance(request):
     # Get app's sentiment stats
     target_app_ids = expand_app_ids(app_id)
     app_reviews = Review.objects.filter(app_id__in=target_app_ids, sentiment_score__isnull=False, counts_toward_score=True)
-    if not app_reviews.exists():
-        return Response({'error': 'No reviews found for this app'}, status=404)
-
     app_stats = app_reviews.aggregate(
         total=Count('id'),
         avg_sentiment=Avg('sentiment_score'),
         positive=Count('id', filter=Q(sentiment_score__gt=0.1)),
         negative=Count('id', filter=Q(sentiment_score__lt=-0.1))
     )
+    if not app_stats['total']:
+        return Response({'error': 'No reviews found for this app'}, status=404)
 
     # Get competitor apps for comparison
-    competitors = list(CompetitorApp.objects.filter(project=project))
-    competitor_app_ids = []
-    for comp in competitors:
-        competitor_app_ids.extend(expand_many_app_ids([comp.app_id, comp.apple_app_id]))
+    competitor_pairs = CompetitorApp.objects.filter(project=project).values_list('app_id', 'apple_app_id')
+    competitor_app_ids = expand_many_app_ids(chain.from_iterable(competitor_pairs))
 
     if project.home_app_id != app_id:
         competitor_app_ids.extend(expand_app_ids(project.home_app_id))
@@ -392,7 +407,7 @@ def trigger_insights_generation(request):
         })
 
     # Get user profile for subscription tier
-    profile = UserProfile.objects.get_or_create(user=request.user)[0]
+    profile = UserProfile.for_user(request.user)
 
     # Start background task
     task = import_google_play_reviews_for_user(
@@ -479,6 +494,7 @@ def check_background_tasks(project, user):
 def check_and_trigger_refreshes(project, user, profile, competitors, app_ids):
     """Check for stale data and trigger refreshes as needed"""
     refresh_tasks = check_background_tasks(project, user)
+    stale_apps = project.needs_refresh_map(app_ids)
 
     # Check and trigger refresh for stale data
     for app_id in app_ids:
@@ -486,7 +502,7 @@ def check_and_trigger_refreshes(project, user, profile, competitors, app_ids):
         if any(task['app_id'] == app_id for task in refresh_tasks):
             continue
 
-        if project.needs_refresh(app_id):
+        if stale_apps[app_id]:
             try:
                 task = import_google_play_reviews_for_user(
                     app_id=app_id,
@@ -546,31 +562,4 @@ from django.dispatch import receiver
 @receiver(post_save, sender=Review)
 def invalidate_cache_on_new_review(sender, instance, **kwargs):
     """Invalidate relevant caches when new reviews are added"""
-    import time
-    timestamp = int(time.time())
-
-    # Update general timestamp
-    cache.set('last_data_update', timestamp)
-
-    # Update app-specific timestamp
-    if instance.app_id:
-        cache.set(f'last_data_update_{instance.app_id}', timestamp)
-
-    # Update project timestamps for projects that include this app
-    if instance.app_id:
-        projects = Project.objects.filter(
-            Q(home_app_id=instance.app_id) |
-            Q(competitors__app_id=instance.app_id)
-        ).distinct()
-
-        for project in projects:
-            cache.set(f'last_project_update_{project.id}', timestamp)
-
-    # Clear cache patterns (if your cache backend supports it)
-    try:
-        cache.delete_pattern("competitor_analysis_*")
-        cache.delete_pattern("enhanced_insights_*")
-        cache.delete_pattern("strategic_performance_*")
-    except AttributeError:
-        # Fallback for cache backends that don't support delete_pattern
-        pass
+    mark_reviews_updated([instance.app_id])
@@ -9,6 +9,7 @@ import django
 import sys
 import time
 from datetime import datetime
+from typing import NamedTuple
 
 
 def setup_django():
@@ -18,32 +19,75 @@ def setup_django():
     django.setup()
 
 
-setup_django()
-
 from google_play_scraper import reviews, Sort
 
 
+class AppSpec(NamedTuple):
+    app_id: str
+    name: str
+
+
+# Focus on productivity apps that failed in the audit
+LOW_DATA_APPS: tuple[AppSpec, ...] = (
+    AppSpec('com.any.do', 'Any.do'),
+    AppSpec('com.appgenix.biztree.todomatrix', 'ToDoMatrix'),
+    AppSpec('com.youneedabudget.ynab.app', 'YNAB'),
+    AppSpec('com.headspace.meditation', 'Headspace'),  # Also test a health app that failed
+)
+
+
+class ReviewSummary:
+    """Running per-app totals, updated in one pass as each page arrives."""
+
+    def __init__(self):
+        self.count = 0
+        self.rating_total = 0
+        self.rated_count = 0
+        self.earliest = None
+        self.latest = None
+        self.positive = 0
+        self.negative = 0
+        self.sample_negative = None
+
+    def add_page(self, page):
+        for review in page:
+            self.count += 1
+            score = review.get('score', 0)
+            if score:
+                self.rating_total += score
+                self.rated_count += 1
+            if score >= 4:
+                self.positive += 1
+            elif score <= 2:
+                self.negative += 1
+                if self.sample_negative is None:
+                    self.sample_negative = review
+
+            at = review.get('at')
+            if at:
+                if self.earliest is None or at < self.earliest:
+                    self.earliest = at
+                if self.latest is None or at > self.latest:
+                    self.latest = at
+
+    @property
+    def avg_rating(self):
+        return self.rating_total / self.rated_count if self.rated_count else 0
+
+
 def test_pagination_for_productivity_apps():
     """Test pagination on productivity apps that returned zero results"""
 
-    # Focus on productivity apps that failed in the audit
-    test_apps = [
-        ('com.any.do', 'Any.do'),
-        ('com.appgenix.biztree.todomatrix', 'ToDoMatrix'),
-        ('com.youneedabudget.ynab.app', 'YNAB'),
-        ('com.headspace.meditation', 'Headspace'),  # Also test a health app that failed
-    ]
-
     print("=== PAGINATION TEST FOR LOW-DATA APPS ===")
     print(f"Started: {datetime.now()}")
     print("Testing apps that returned 0 reviews in initial audit")
     print("=" * 60)
 
-    for app_id, app_name in test_apps:
+    for app_id, app_name in LOW_DATA_APPS:
         print(f"\n{'=' * 20} {app_name} {'=' * 20}")
         print(f"App ID: {app_id}")
 
-        total_reviews = []
+        summary = ReviewSummary()
         page_count = 0
         continuation_token = None
         max_pages = 5  # Limit to prevent infinite loops
@@ -72,7 +116,7 @@ def test_pagination_for_productivity_apps():
 
                 if result and len(result) > 0:
                     print(f"  ✓ Found {len(result)} reviews")
-                    total_reviews.extend(result)
+                    summary.add_page(result)
 
                     # Show sample of first and last review from this page
                     first_review = result[0]
@@ -101,31 +145,22 @@ def test_pagination_for_productivity_apps():
         # Summary for this app
         print(f"\n--- {app_name} Summary ---")
         print(f"Total pages retrieved: {page_count}")
-        print(f"Total reviews found: {len(total_reviews)}")
+        print(f"Total reviews found: {summary.count}")
 
-        if total_reviews:
+        if summary.count:
             # Analyze the review data
-            ratings = [r.get('score', 0) for r in total_reviews if r.get('score')]
-            avg_rating = sum(ratings) / len(ratings) if ratings else 0
+            if summary.earliest is not None:
+                print(f"Date range: {summary.earliest} to {summary.latest}")
 
-            # Get date range
-            dates = [r.get('at') for r in total_reviews if r.get('at')]
-            if dates:
-                print(f"Date range: {min(dates)} to {max(dates)}")
-
-            print(f"Average rating: {avg_rating:.1f}/5")
+            print(f"Average rating: {summary.avg_rating:.1f}/5")
 
             # Show sentiment distribution preview
-            positive_reviews = [r for r in total_reviews if r.get('score', 0) >= 4]
-            negative_reviews = [r for r in total_reviews if r.get('score', 0) <= 2]
-
-            print(f"Positive reviews (4-5 stars): {len(positive_reviews)}")
-            print(f"Negative reviews (1-2 stars): {len(negative_reviews)}")
+            print(f"Positive reviews (4-5 stars): {summary.positive}")
+            print(f"Negative reviews (1-2 stars): {summary.negative}")
 
             # Sample negative review for pain point analysis
-            if negative_reviews:
-                sample_negative = negative_reviews[0]
-                print(f"Sample negative: '{sample_negative.get('content', '')[:100]}...'")
+            if summary.sample_negative:
+                print(f"Sample negative: '{summary.sample_negative.get('content', '')[:100]}...'")
         else:
             print("No reviews found even with pagination")
 
@@ -196,6 +231,8 @@ def test_single_successful_app_pagination():
 
 
 if __name__ == "__main__":
+    setup_django()
+
     # First test the apps that showed zero results
     test_pagination_for_productivity_apps()
 
@@ -7,6 +7,7 @@ by checking app details and trying alternative package names
 import os
 import django
 import sys
+from typing import NamedTuple
 
 
 def setup_django():
@@ -16,55 +17,96 @@ def setup_django():
     django.setup()
 
 
-setup_django()
-
 from google_play_scraper import app, reviews, Sort
 
 
+class AppSpec(NamedTuple):
+    app_id: str
+    name: str
+
+
+# Apps that returned zero reviews in our tests
+FAILED_APPS: tuple[AppSpec, ...] = (
+    AppSpec('com.any.do', 'Any.do'),
+    AppSpec('com.appgenix.biztree.todomatrix', 'ToDoMatrix'),
+    AppSpec('com.youneedabudget.ynab.app', 'YNAB'),
+    AppSpec('com.headspace.meditation', 'Headspace'),
+)
+
+# Alternative app IDs to test for these popular apps
+ALTERNATIVE_IDS = {
+    'Any.do': (
+        'com.anydo',
+        'com.any.do.app',
+        'com.any.do.android',
+        'anydo.android'
+    ),
+    'YNAB': (
+        'com.youneedabudget.ynab',
+        'com.ynab.classic',
+        'com.youneedabudget.android',
+        'youneedabudget.ynab'
+    ),
+    'Headspace': (
+        'com.headspace',
+        'com.headspace.app',
+        'headspace.meditation',
+        'com.headspace.android'
+    ),
+    'ToDoMatrix': (
+        'com.appgenix.biztree.todomatrix',
+        'com.todomatrix',
+        'todomatrix.android',
+        'biztree.todomatrix'
+    )
+}
+
+# Known working productivity apps to compare against
+KNOWN_PRODUCTIVITY_APP_IDS = (
+    'com.microsoft.office.outlook',  # Microsoft Outlook
+    'com.slack',  # Slack
+    'com.notion.id',  # Notion
+    'com.atlassian.android.jira.core',  # Jira
+    'com.microsoft.teams',  # Microsoft Teams
+    'com.asana.app',  # Asana
+    'com.dropbox.android',  # Dropbox
+    'com.evernote',  # Evernote
+)
+
+PRODUCTIVITY_TEST_APPS: tuple[AppSpec, ...] = (
+    # Task Management
+    AppSpec('com.todoist', 'Todoist'),
+    AppSpec('com.any.do', 'Any.do'),
+    AppSpec('com.microsoft.todos', 'Microsoft To Do'),
+    AppSpec('com.ticktick.task', 'TickTick'),
+    AppSpec('wunderlist.android', 'Wunderlist'),
+
+    # Note Taking
+    AppSpec('com.evernote', 'Evernote'),
+    AppSpec('com.notion.id', 'Notion'),
+    AppSpec('com.microsoft.office.onenote', 'OneNote'),
+    AppSpec('md.obsidian', 'Obsidian'),
+
+    # Communication
+    AppSpec('com.slack', 'Slack'),
+    AppSpec('com.microsoft.teams', 'Microsoft Teams'),
+    AppSpec('us.zoom.videomeetings', 'Zoom'),
+
+    # Project Management
+    AppSpec('com.asana.app', 'Asana'),
+    AppSpec('com.atlassian.android.jira.core', 'Jira'),
+    AppSpec('com.monday.monday', 'Monday.com'),
+)
+
+
 def validate_app_existence():
     """Check if the app IDs we used actually exist and get their details"""
 
-    # Apps that returned zero reviews in our tests
-    failed_apps = [
-        ('com.any.do', 'Any.do'),
-        ('com.appgenix.biztree.todomatrix', 'ToDoMatrix'),
-        ('com.youneedabudget.ynab.app', 'YNAB'),
-        ('com.headspace.meditation', 'Headspace'),
-    ]
-
-    # Alternative app IDs to test for these popular apps
-    alternative_ids = {
-        'Any.do': [
-            'com.anydo',
-            'com.any.do.app',
-            'com.any.do.android',
-            'anydo.android'
-        ],
-        'YNAB': [
-            'com.youneedabudget.ynab',
-            'com.ynab.classic',
-            'com.youneedabudget.android',
-            'youneedabudget.ynab'
-        ],
-        'Headspace': [
-            'com.headspace',
-            'com.headspace.app',
-            'headspace.meditation',
-            'com.headspace.android'
-        ],
-        'ToDoMatrix': [
-            'com.appgenix.biztree.todomatrix',
-            'com.todomatrix',
-            'todomatrix.android',
-            'biztree.todomatrix'
-        ]
-    }
-
     print("=== VALIDATING APP IDS ===")
     print("Checking if failed app IDs exist and testing alternatives")
     print("=" * 50)
 
-    for app_id, app_name in failed_apps:
+    for app_id, app_name in FAILED_APPS:
         print(f"\n{'=' * 20} {app_name} {'=' * 20}")
 
         # Test original app ID
@@ -91,8 +133,8 @@ def validate_app_existence():
             print(f"  Testing alternative IDs for {app_name}:")
 
             # Test alternative IDs
-            if app_name in alternative_ids:
-                for alt_id in alternative_ids[app_name]:
+            if app_name in ALTERNATIVE_IDS:
+                for alt_id in ALTERNATIVE_IDS[app_name]:
                     print(f"    Trying: {alt_id}")
                     try:
                         alt_app_info = app(alt_id)
@@ -121,22 +163,10 @@ def validate_app_existence():
 def search_google_play_manually():
     """Manually search for correct app IDs by checking Google Play Store directly"""
 
-    # Let's also test some known working productivity apps to compare
-    known_productivity_apps = [
-        'com.microsoft.office.outlook',  # Microsoft Outlook
-        'com.slack',  # Slack
-        'com.notion.id',  # Notion
-        'com.atlassian.android.jira.core',  # Jira
-        'com.microsoft.teams',  # Microsoft Teams
-        'com.asana.app',  # Asana
-        'com.dropbox.android',  # Dropbox
-        'com.evernote',  # Evernote
-    ]
-
     print(f"\n=== TESTING KNOWN PRODUCTIVITY APPS ===")
     print("Testing popular productivity apps that should definitely have reviews")
 
-    for app_id in known_productivity_apps:
+    for app_id in KNOWN_PRODUCTIVITY_APP_IDS:
         print(f"\nTesting: {app_id}")
 
         try:
@@ -168,38 +198,13 @@ def search_google_play_manually():
 def comprehensive_productivity_test():
     """Test a comprehensive list of productivity apps to see the pattern"""
 
-    productivity_test_apps = [
-        # Task Management
-        ('com.todoist', 'Todoist'),
-        ('com.any.do', 'Any.do'),
-        ('com.microsoft.todos', 'Microsoft To Do'),
-        ('com.ticktick.task', 'TickTick'),
-        ('wunderlist.android', 'Wunderlist'),
-
-        # Note Taking
-        ('com.evernote', 'Evernote'),
-        ('com.notion.id', 'Notion'),
-        ('com.microsoft.office.onenote', 'OneNote'),
-        ('md.obsidian', 'Obsidian'),
-
-        # Communication
-        ('com.slack', 'Slack'),
-        ('com.microsoft.teams', 'Microsoft Teams'),
-        ('us.zoom.videomeetings', 'Zoom'),
-
-        # Project Management
-        ('com.asana.app', 'Asana'),
-        ('com.atlassian.android.jira.core', 'Jira'),
-        ('com.monday.monday', 'Monday.com'),
-    ]
-
     print(f"\n=== COMPREHENSIVE PRODUCTIVITY APP TEST ===")
     print("Testing wide range of productivity apps to identify data availability patterns")
 
     successful_apps = []
     failed_apps = []
 
-    for app_id, app_name in productivity_test_apps:
+    for app_id, app_name in PRODUCTIVITY_TEST_APPS:
         print(f"\nTesting {app_name}: {app_id}")
 
         try:
@@ -228,13 +233,15 @@ def comprehensive_productivity_test():
     for name, app_id in failed_apps:
         print(f"  ✗ {name}")
 
-    success_rate = len(successful_apps) / len(productivity_test_apps) * 100
+    success_rate = len(successful_apps) / len(PRODUCTIVITY_TEST_APPS) * 100
     print(f"\nProductivity app success rate: {success_rate:.1f}%")
 
     return successful_apps, failed_apps
 
 
 if __name__ == "__main__":
+    setup_django()
+
     # Step 1: Validate the specific IDs that failed
     validate_app_existence()
 